@@ -16,9 +16,10 @@
     'version': '0.1',
     'application': True,
     'installable': True,
-    'depends': ['base', 'web', 'mail', 'crm'],
+    'depends': ['base', 'web', 'bus', 'mail', 'crm', 'estate'],
 
     'data': [
+        'data/ir_cron_data.xml',
         'views/views.xml',
     ],
     'assets': {
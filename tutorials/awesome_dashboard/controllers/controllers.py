@@ -1,36 +1,102 @@
 # -*- coding: utf-8 -*-
 
+import hashlib
+import json
 import logging
-import random
+import time
 
-from odoo import http
+from odoo import fields, http
 from odoo.http import request
 
+from odoo.addons.estate.models.estate_stats_daily import WATERMARK_PARAM
+
+from ..models.dashboard_statistics import (
+    get_cache_window, get_statistics_lock, statistics_cache, statistics_generation,
+)
+
 logger = logging.getLogger(__name__)
 
 class AwesomeDashboard(http.Controller):
     @http.route('/awesome_dashboard/statistics', type='json', auth='user')
-    def get_statistics(self):
+    def get_statistics(self, etag=None):
         """
-        Returns a dict of statistics about the orders:
-            'average_quantity': the average number of t-shirts by order
-            'average_time': the average time (in hours) elapsed between the
-                moment an order is created, and the moment is it sent
-            'nb_cancelled_orders': the number of cancelled orders, this month
-            'nb_new_orders': the number of new orders, this month
-            'total_amount': the total amount of orders, this month
+        Returns a dict of statistics about the real estate activity:
+            'nb_new_offers': the number of offers made this month
+            'average_offer_price': the average price of the offers made this month
+            'nb_cancelled_properties': the number of cancelled properties
+            'properties_by_type': the number of properties per property type
+            'total_sold_amount': the total selling price of the sold properties
+
+        plus their 'etag'. When ``etag`` matches the current one, only
+        {'unchanged': True, 'etag': etag} is returned.
+
+        The result is computed at most once per cache window (system
+        parameter awesome_dashboard.statistics_cache_seconds) and shared by
+        every open dashboard.
         """
+        env = request.env
+        window = get_cache_window(env)
+        key = env.cr.dbname
 
-        return {
-            'average_quantity': random.randint(4, 12),
-            'average_time': random.randint(4, 123),
-            'nb_cancelled_orders': random.randint(0, 50),
-            'nb_new_orders': random.randint(10, 200),
-            'orders_by_size': {
-                'm': random.randint(0, 150),
-                's': random.randint(0, 150),
-                'xl': random.randint(0, 150),
-            },
-            'total_amount': random.randint(100, 1000)
+        expires, generation, statistics, current_etag = statistics_cache.get(key, (0, None, None, None))
+        if expires < time.monotonic() or generation != statistics_generation.get(key, 0):
+            # one computation at a time per database, the others wait for its result
+            with get_statistics_lock(key):
+                expires, generation, statistics, current_etag = statistics_cache.get(key, (0, None, None, None))
+                current_generation = statistics_generation.get(key, 0)
+                if expires < time.monotonic() or generation != current_generation:
+                    statistics = self._compute_statistics(env(su=True))
+                    current_etag = hashlib.sha1(json.dumps(statistics, sort_keys=True).encode()).hexdigest()
+                    # changed meanwhile: serve the result but keep it out of the cache
+                    if current_generation == statistics_generation.get(key, 0):
+                        statistics_cache[key] = (time.monotonic() + window, current_generation, statistics, current_etag)
+
+        if etag == current_etag:
+            return {'unchanged': True, 'etag': current_etag}
+        return dict(statistics, etag=current_etag)
+
+    def _compute_statistics(self, env):
+        """A handful of grouped aggregates, offers and sales read from the daily rollups.
+
+        The rollups are complete up to the day of the last refresh: the
+        offers and sales of the days since are aggregated live, so they reach
+        the dashboard without waiting for the rollup cron.
+        """
+        Stats = env['estate.stats.daily']
+        Property = env['estate.property'].with_context(active_test=False)
+        month_start = fields.Date.today().replace(day=1)
+        watermark = env['ir.config_parameter'].get_param(WATERMARK_PARAM)
+        live_start = fields.Datetime.to_datetime(watermark).date() if watermark else None
+
+        [(nb_new_offers, offer_amount)] = Stats._read_group(
+            [('date', '>=', month_start), ('date', '<', live_start or month_start)],
+            [], ['offer_count:sum', 'offer_amount:sum'],
+        )
+        [(live_offers, live_offer_amount)] = env['estate.property.offer']._read_group(
+            [('create_date', '>=', max(live_start or month_start, month_start))], [], ['__count', 'price:sum'],
+        )
+        nb_new_offers = (nb_new_offers or 0) + live_offers
+        offer_amount = (offer_amount or 0.0) + (live_offer_amount or 0.0)
+
+        total_sold_amount = 0.0
+        if live_start:
+            [(total_sold_amount,)] = Stats._read_group([('date', '<', live_start)], [], ['revenue:sum'])
+        [(live_sold_amount,)] = Property._read_group(
+            [('state', '=', 'sold')] + ([('date_sold', '>=', live_start)] if live_start else []),
+            [], ['selling_price:sum'],
+        )
+        total_sold_amount = (total_sold_amount or 0.0) + (live_sold_amount or 0.0)
+
+        nb_cancelled_properties = Property.search_count([('state', '=', 'cancelled')])
+        properties_by_type = {
+            ptype.name: count
+            for ptype, count in Property._read_group([], ['property_type_id'], ['__count'])
         }
 
+        return {
+            'nb_new_offers': nb_new_offers,
+            'average_offer_price': round(offer_amount / nb_new_offers, 2) if nb_new_offers else 0.0,
+            'nb_cancelled_properties': nb_cancelled_properties,
+            'properties_by_type': properties_by_type,
+            'total_sold_amount': total_sold_amount,
+        }
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from . import dashboard_statistics
+from . import estate_property
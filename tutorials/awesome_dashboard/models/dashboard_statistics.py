@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+STATISTICS_CHANNEL = 'awesome_dashboard.statistics'
+STATISTICS_UPDATED = 'awesome_dashboard/statistics_updated'
+
+CACHE_SECONDS_PARAM = 'awesome_dashboard.statistics_cache_seconds'
+DEFAULT_CACHE_SECONDS = 30
+
+# per database: (expires, generation, statistics, etag)
+statistics_cache = {}
+# per database: bumped by every change, a cache entry is valid for its own generation only
+statistics_generation = {}
+_database_locks = {}
+_database_locks_lock = threading.Lock()
+_last_push = {}
+# per database: when the trailing push of the current window was scheduled
+_trailing_push = {}
+
+
+def get_statistics_lock(dbname):
+    """Lock serializing the computation of the statistics of one database."""
+    lock = _database_locks.get(dbname)
+    if lock is None:
+        with _database_locks_lock:
+            lock = _database_locks.setdefault(dbname, threading.Lock())
+    return lock
+
+
+def get_cache_window(env):
+    """Cache window of the statistics, also the minimal delay between two bus pushes."""
+    return int(env['ir.config_parameter'].sudo().get_param(CACHE_SECONDS_PARAM, DEFAULT_CACHE_SECONDS))
+
+
+def notify_statistics_changed(env):
+    """Drop the cached statistics and tell the open dashboards, at most once per window.
+
+    The first change of a window is pushed right away, later ones by a
+    single trailing push when the window ends, so the last change of a
+    burst always reaches the dashboards.
+    """
+    dbname = env.cr.dbname
+    # no lock: the write path must not wait for a running computation, which
+    # compares the generation before storing its result
+    _invalidate(dbname)
+    # readers of other transactions may cache the old data until the commit
+    if not env.cr.postcommit.data.get('awesome_dashboard.invalidate'):
+        env.cr.postcommit.data['awesome_dashboard.invalidate'] = True
+        env.cr.postcommit.add(lambda: _invalidate(dbname))
+
+    now = time.monotonic()
+    window = get_cache_window(env)
+    last = _last_push.get(dbname, 0)
+    if now - last >= window:
+        _last_push[dbname] = now
+        # sent on commit
+        env['bus.bus']._sendone(STATISTICS_CHANNEL, STATISTICS_UPDATED, {})
+    elif _trailing_push.get(dbname, 0) <= last:
+        _trailing_push[dbname] = now
+        # the trigger commits with the change, and runs in any worker
+        env.ref('awesome_dashboard.ir_cron_statistics_push').sudo()._trigger(
+            at=fields.Datetime.now() + timedelta(seconds=last + window - now),
+        )
+
+
+def _invalidate(dbname):
+    statistics_generation[dbname] = statistics_generation.get(dbname, 0) + 1
+    statistics_cache.pop(dbname, None)
+
+
+class DashboardStatistics(models.AbstractModel):
+    _name = 'awesome_dashboard.statistics'
+    _description = 'Dashboard Statistics Notifications'
+
+    @api.model
+    def _cron_push_statistics(self):
+        """Trailing push of the changes debounced by notify_statistics_changed."""
+        _last_push[self.env.cr.dbname] = time.monotonic()
+        self.env['bus.bus']._sendone(STATISTICS_CHANNEL, STATISTICS_UPDATED, {})
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, models, tools
+
+from .dashboard_statistics import notify_statistics_changed
+
+# estate.property fields the dashboard statistics depend on
+STATISTICS_FIELDS = {'state', 'property_type_id', 'active', 'selling_price', 'date_sold'}
+# estate.property.offer fields the dashboard statistics depend on
+OFFER_STATISTICS_FIELDS = {'price', 'property_id'}
+
+
+class EstateProperty(models.Model):
+    _inherit = 'estate.property'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        notify_statistics_changed(self.env)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if STATISTICS_FIELDS & vals.keys():
+            notify_statistics_changed(self.env)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        notify_statistics_changed(self.env)
+        return res
+
+
+class EstatePropertyOffer(models.Model):
+    _inherit = 'estate.property.offer'
+
+    def init(self):
+        super().init()
+        # serves the live aggregate of the offers not rolled up yet
+        tools.create_index(
+            self._cr, 'estate_property_offer_create_date_idx', self._table, ['create_date'],
+        )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        notify_statistics_changed(self.env)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if OFFER_STATISTICS_FIELDS & vals.keys():
+            notify_statistics_changed(self.env)
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        notify_statistics_changed(self.env)
+        return res
+
+
+class EstateStatsDaily(models.Model):
+    _inherit = 'estate.stats.daily'
+
+    # the rolled-up days move from the live aggregates to the rollups
+    @api.model
+    def _cron_refresh(self, full=False):
+        days = super()._cron_refresh(full=full)
+        if days:
+            notify_statistics_changed(self.env)
+        return days
@@ -4,58 +4,49 @@ import { registry } from "@web/core/registry";
 
 const items = [
     {
-        id: "average_quantity",
-        description: "Average amount of t-shirt",
+        id: "number_new_offers",
+        description: "New offers this month",
         Component: NumberCard,
         props: (data) => ({
-            title: "Average amount of t-shirt by order this month",
-            value: data.average_quantity,
+            title: "Number of new offers this month",
+            value: data.nb_new_offers,
         })
     },
     {
-        id: "average_time",
-        description: "Average time for an order",
+        id: "average_offer_price",
+        description: "Average offer price",
         Component: NumberCard,
         props: (data) => ({
-            title: "Average time for an order to go from 'new' to 'sent' or 'cancelled'",
-            value: data.average_time,
+            title: "Average price of the offers made this month",
+            value: data.average_offer_price,
         })
     },
     {
-        id: "number_new_orders",
-        description: "New orders this month",
+        id: "cancelled_properties",
+        description: "Cancelled properties",
         Component: NumberCard,
         props: (data) => ({
-            title: "Number of new orders this month",
-            value: data.nb_new_orders,
+            title: "Number of cancelled properties",
+            value: data.nb_cancelled_properties,
         })
     },
     {
-        id: "cancelled_orders",
-        description: "Cancelled orders this month",
+        id: "total_sold_amount",
+        description: "Total sold amount",
         Component: NumberCard,
         props: (data) => ({
-            title: "Number of cancelled orders this month",
-            value: data.nb_cancelled_orders,
-        })
-    },
-    {
-        id: "amount_new_orders",
-        description: "amount orders this month",
-        Component: NumberCard,
-        props: (data) => ({
-            title: "Total amount of new orders this month",
-            value: data.total_amount,
+            title: "Total selling price of the sold properties",
+            value: data.total_sold_amount,
         })
     },
     {
         id: "pie_chart",
-        description: "Shirt orders by size",
+        description: "Properties by type",
         Component: PieChartCard,
         size: 2,
         props: (data) => ({
-            title: "Shirt orders by size",
-            values: data.orders_by_size,
+            title: "Properties by type",
+            values: data.properties_by_type,
         })
     }
 ]
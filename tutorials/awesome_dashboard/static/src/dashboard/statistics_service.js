@@ -2,20 +2,30 @@ import { registry } from "@web/core/registry";
 import { reactive } from "@odoo/owl";
 import { rpc } from "@web/core/network/rpc";
 
+// the server pushes a notification when the statistics change: polling is only a fallback
+const FALLBACK_POLL_INTERVAL = 60 * 1000;
+
 const statisticsService = {
-    start(){
+    dependencies: ["bus_service"],
+    start(env, { bus_service }){
         const statistics = reactive({ isReady: false});
+        let etag = null;
 
         async function loadData(){
-            const updates = await rpc("/awesome_dashboard/statistics");
-            Object.assign(statistics, updates, { isReady: true});
+            const updates = await rpc("/awesome_dashboard/statistics", { etag });
+            etag = updates.etag;
+            if (!updates.unchanged) {
+                Object.assign(statistics, updates, { isReady: true});
+            }
         }
 
-        setInterval(loadData, 5*1000);
+        bus_service.addChannel("awesome_dashboard.statistics");
+        bus_service.subscribe("awesome_dashboard/statistics_updated", loadData);
+        setInterval(loadData, FALLBACK_POLL_INTERVAL);
         loadData();
 
         return statistics;
     },
 };
 
-registry.category("services").add("awesome_dashboard.statistics", statisticsService);
\ No newline at end of file
+registry.category("services").add("awesome_dashboard.statistics", statisticsService);
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from . import test_dashboard_statistics
+from . import test_dashboard_benchmark
\ No newline at end of file
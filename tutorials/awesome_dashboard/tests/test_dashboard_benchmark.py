@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import threading
+import time
+
+from odoo.tests import HttpCase, tagged
+
+from ..controllers.controllers import AwesomeDashboard
+from ..models.dashboard_statistics import get_statistics_lock, statistics_cache
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('-standard', 'dashboard_benchmark')
+class TestDashboardBenchmark(HttpCase):
+    """Benchmarks, run on demand with ``--test-tags dashboard_benchmark``."""
+
+    OFFERS = 1_000_000
+    PROPERTIES = 10_000
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        property_type = cls.env['estate.property.type'].create({'name': 'House'})
+        partner = cls.env['res.partner'].create({'name': 'Bidder'})
+        cls.env.flush_all()
+        cr = cls.env.cr
+        # plain SQL, the ORM would spend minutes on a million offers
+        cr.execute("""
+            INSERT INTO estate_property (name, property_type_id, expected_price, bedrooms, facades,
+                                         active, state, create_date, write_date)
+            SELECT 'Property ' || i, %(type)s, 100000, 2, 1, TRUE, 'offer_received',
+                   now() AT TIME ZONE 'UTC', now() AT TIME ZONE 'UTC'
+              FROM generate_series(1, %(properties)s) i
+         RETURNING id
+        """, {'type': property_type.id, 'properties': cls.PROPERTIES})
+        property_ids = [row[0] for row in cr.fetchall()]
+        cr.execute("""
+            INSERT INTO estate_property_offer (property_id, property_type_id, partner_id, price, status,
+                                               validity, create_date, write_date)
+            SELECT (%(property_ids)s::int[])[1 + i %% %(properties)s], %(type)s, %(partner)s,
+                   1000 + i, 'draft', 7, d, d
+              FROM generate_series(1, %(offers)s) i,
+                   LATERAL (SELECT (now() AT TIME ZONE 'UTC') - (i %% 365) * interval '1 day' AS d) dates
+        """, {
+            'property_ids': property_ids,
+            'properties': cls.PROPERTIES,
+            'type': property_type.id,
+            'partner': partner.id,
+            'offers': cls.OFFERS,
+        })
+        cr.execute("ANALYZE estate_property_offer")
+        cls.env.invalidate_all()
+
+    def _report(self, name, duration, **extra):
+        details = ''.join(f', {key}={value}' for key, value in extra.items())
+        _logger.info("dashboard benchmark %s: %.3fs%s", name, duration, details)
+
+    def test_statistics_on_1m_offers(self):
+        start = time.time()
+        days = self.env['estate.stats.daily']._cron_refresh(full=True)
+        self._report('full rollup refresh', time.time() - start, offers=self.OFFERS, days=days)
+
+        # the former computation, straight on the offers
+        month_start = time.strftime('%Y-%m-01')
+        start = time.time()
+        self.env['estate.property.offer']._read_group(
+            [('create_date', '>=', month_start)], [], ['__count', 'price:avg'],
+        )
+        self._report('offer aggregate (no rollup)', time.time() - start)
+
+        start = time.time()
+        statistics = AwesomeDashboard()._compute_statistics(self.env)
+        self._report('statistics from the rollups', time.time() - start)
+        self.assertEqual(statistics['properties_by_type'], {'House': self.PROPERTIES})
+
+        self.authenticate('admin', 'admin')
+        statistics_cache.pop(self.env.cr.dbname, None)
+        start = time.time()
+        self.make_jsonrpc_request('/awesome_dashboard/statistics', {})
+        self._report('statistics request (cold)', time.time() - start)
+        start = time.time()
+        requests = 50
+        for _i in range(requests):
+            self.make_jsonrpc_request('/awesome_dashboard/statistics', {})
+        duration = time.time() - start
+        self._report('statistics request (cached)', duration / requests, requests=requests)
+
+    def test_write_latency_during_computation(self):
+        """Property writes keep their pace while the statistics are computed."""
+        lock = get_statistics_lock(self.env.cr.dbname)
+        computing, done = threading.Event(), threading.Event()
+
+        def slow_computation():
+            with lock:
+                computing.set()
+                done.wait(30)
+
+        thread = threading.Thread(target=slow_computation)
+        thread.start()
+        try:
+            computing.wait(10)
+            prop = self.env['estate.property'].search([], limit=1)
+            writes = 200
+            start = time.time()
+            for i in range(writes):
+                # notifies the dashboards, see estate_property.py
+                prop.write({'active': bool(i % 2)})
+            duration = time.time() - start
+        finally:
+            done.set()
+            thread.join()
+        self._report('property writes during a computation', duration / writes, writes=writes)
+        self.assertLess(duration, 10)
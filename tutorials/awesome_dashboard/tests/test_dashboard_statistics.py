@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from unittest.mock import patch
+
+from odoo.tests import HttpCase, tagged
+
+from ..controllers.controllers import AwesomeDashboard
+from ..models.dashboard_statistics import (
+    _last_push, _trailing_push, get_statistics_lock, notify_statistics_changed, statistics_cache,
+)
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardStatistics(HttpCase):
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate('admin', 'admin')
+        statistics_cache.pop(self.env.cr.dbname, None)
+
+    def _get_statistics(self, etag=None):
+        return self.make_jsonrpc_request('/awesome_dashboard/statistics', {'etag': etag})
+
+    def test_statistics_cached_until_changed(self):
+        first = self._get_statistics()
+        self.assertEqual(self._get_statistics(first['etag']), {'unchanged': True, 'etag': first['etag']})
+
+        with patch.object(AwesomeDashboard, '_compute_statistics', autospec=True,
+                          side_effect=AwesomeDashboard._compute_statistics) as compute:
+            self._get_statistics()
+            self.assertEqual(compute.call_count, 0)
+            notify_statistics_changed(self.env)
+            self._get_statistics()
+            self.assertEqual(compute.call_count, 1)
+
+    def test_change_during_computation_is_not_cached(self):
+        compute = AwesomeDashboard._compute_statistics
+
+        def compute_and_change(controller, env):
+            result = compute(controller, env)
+            # a property written while the statistics were being computed
+            notify_statistics_changed(self.env)
+            return result
+
+        with patch.object(AwesomeDashboard, '_compute_statistics', autospec=True, side_effect=compute_and_change):
+            self._get_statistics()
+        self.assertNotIn(self.env.cr.dbname, statistics_cache)
+
+    def test_write_path_does_not_wait_for_computation(self):
+        lock = get_statistics_lock(self.env.cr.dbname)
+        locked, release = threading.Event(), threading.Event()
+
+        def computing():
+            with lock:
+                locked.set()
+                release.wait(10)
+
+        thread = threading.Thread(target=computing)
+        thread.start()
+        try:
+            locked.wait(10)
+            start = time.time()
+            notify_statistics_changed(self.env)
+            self.assertLess(time.time() - start, 1)
+        finally:
+            release.set()
+            thread.join()
+
+    def test_lock_per_database(self):
+        self.assertIs(get_statistics_lock('db1'), get_statistics_lock('db1'))
+        self.assertIsNot(get_statistics_lock('db1'), get_statistics_lock('db2'))
+
+    def test_burst_ends_with_trailing_push(self):
+        dbname = self.env.cr.dbname
+        _last_push.pop(dbname, None)
+        _trailing_push.pop(dbname, None)
+        cron = self.env.ref('awesome_dashboard.ir_cron_statistics_push')
+        Trigger = self.env['ir.cron.trigger']
+        triggers = Trigger.search([('cron_id', '=', cron.id)])
+        BusBus = type(self.env['bus.bus'])
+
+        with patch.object(BusBus, '_sendone', autospec=True) as sendone:
+            notify_statistics_changed(self.env)
+            self.assertEqual(sendone.call_count, 1)
+
+            # the rest of the burst: no push now, a single one at the end of the window
+            for _i in range(3):
+                notify_statistics_changed(self.env)
+            self.assertEqual(sendone.call_count, 1)
+            new_triggers = Trigger.search([('cron_id', '=', cron.id)]) - triggers
+            self.assertEqual(len(new_triggers), 1)
+
+            self.env['awesome_dashboard.statistics']._cron_push_statistics()
+            self.assertEqual(sendone.call_count, 2)
+
+            # a change after the trailing push schedules a new one
+            notify_statistics_changed(self.env)
+            self.assertEqual(len(Trigger.search([('cron_id', '=', cron.id)]) - triggers), 2)
+
+    def test_offers_and_sales_before_the_rollup_refresh(self):
+        self.env['estate.stats.daily']._cron_refresh(full=True)
+        before = self._get_statistics()
+
+        prop = self.env['estate.property'].create({
+            'name': 'Dashboard listing',
+            'property_type_id': self.env['estate.property.type'].create({'name': 'Dashboard type'}).id,
+            'expected_price': 1000.0,
+        })
+        partner = self.env['res.partner'].create({'name': 'Dashboard bidder'})
+        self.env['estate.property.offer'].create({'property_id': prop.id, 'partner_id': partner.id, 'price': 950.0})
+        prop.write({'state': 'sold', 'selling_price': 950.0})
+
+        # offer and sale notify the dashboards, and show before the rollup cron
+        after = self._get_statistics()
+        self.assertEqual(after['nb_new_offers'], before['nb_new_offers'] + 1)
+        self.assertEqual(after['total_sold_amount'], before['total_sold_amount'] + 950.0)
+
+        # once rolled up, they are not counted twice
+        self.env['estate.stats.daily']._cron_refresh()
+        rolled_up = self._get_statistics()
+        self.assertEqual(rolled_up['nb_new_offers'], after['nb_new_offers'])
+        self.assertEqual(rolled_up['total_sold_amount'], after['total_sold_amount'])
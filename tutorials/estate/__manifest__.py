@@ -9,12 +9,14 @@
     'description': 'A module for managing real estate properties',
     'data': [
         'security/ir.model.access.csv',
+        'data/ir_cron_data.xml',
         'views/estate_property_views.xml',
         'views/estate_property_offer_views.xml',
         'views/estate_property_type_views.xml',
         'views/estate_property_tag_views.xml',
         'views/estate_search_views.xml',
         'views/res_users_views.xml',
+        'views/estate_stats_daily_views.xml',
     ],
     'installable': True,
     'application': True,
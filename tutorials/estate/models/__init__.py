@@ -2,4 +2,6 @@ from . import estate_property
 from . import estate_property_type
 from . import estate_property_tag
 from . import estate_property_offer
+from . import estate_property_import
+from . import estate_stats_daily
 from . import res_users
\ No newline at end of file
@@ -1,5 +1,6 @@
 import datetime
 from odoo import models, fields, api, _
+from odoo.tools import SQL
 from odoo.exceptions import UserError, ValidationError
 
 
@@ -61,6 +62,8 @@ class EstateProperty(models.Model):
         "res.partner",
         string="Buyer",
         copy=False)
+
+    date_sold = fields.Date(string='Date Sold', readonly=True, copy=False)
     
     tag_ids = fields.Many2many(
         "estate.property.tag",
@@ -76,9 +79,9 @@ class EstateProperty(models.Model):
         )
     
     best_price = fields.Float(
-        compute='_compute_best_price', 
-        store=True,
-        compute_sudo=True)
+        readonly=True,
+        copy=False,
+        help="Highest offer price, maintained incrementally by the offers")
     
     total_area = fields.Float(
         string="Total Area (sqm)",
@@ -103,12 +106,50 @@ class EstateProperty(models.Model):
             self.garden_area = 0.0
             self.garden_orientation = False
         
-    @api.depends('offer_ids.price')
-    def _compute_best_price(self):
+    def _update_best_price(self, prices):
+        """Raise best_price to the candidate {property_id: price} where it is higher."""
         for rec in self:
-            prices = rec.offer_ids.mapped('price')
-            rec.best_price = max(prices) if prices else 0.0
+            price = prices.get(rec.id, 0.0)
+            if price > rec.best_price:
+                rec.best_price = price
+
+    def _recompute_best_price(self):
+        """Full rescan of best_price, with a single SQL MAX grouped by property.
+
+        Properties left without any live offer fall back from 'offer_received' to 'new'.
+        """
+        best_prices = self.env['estate.property.offer']._get_max_prices(self.ids)
+        for rec in self:
+            rec.best_price = best_prices.get(rec.id, 0.0)
+            if rec.state == 'offer_received' and rec.id not in best_prices:
+                rec.state = 'new'
     
+    def _lock_for_offers(self):
+        """Row-lock the properties (FOR UPDATE) to serialize concurrent offers on them."""
+        if not self.ids:
+            return
+        self.env.cr.execute(SQL(
+            "SELECT id FROM %s WHERE id IN %s ORDER BY id FOR UPDATE",
+            SQL.identifier(self._table),
+            tuple(self.ids),
+        ))
+
+    def _place_bid(self, partner, amount):
+        """Create an offer of the partner, serialized with the other bids on the property."""
+        self.ensure_one()
+        self._lock_for_offers()
+        # re-read under the lock: a concurrent bid may have just committed
+        self.invalidate_recordset(['state', 'best_price'])
+        if self.state in ('sold', 'cancelled'):
+            raise UserError(_("This property no longer accepts offers."))
+        if amount <= self.best_price:
+            raise ValidationError(_("Offer price must be strictly higher than existing offers."))
+        return self.env['estate.property.offer'].create({
+            'price': amount,
+            'partner_id': partner.id,
+            'property_id': self.id,
+        })
+
     def action_cancel(self):
         self.ensure_one()
 
@@ -118,11 +159,11 @@ class EstateProperty(models.Model):
             rec.state = 'cancelled'
     
     def action_sold(self):
-        self.ensure_one()
         for rec in self:
             if rec.state == 'sold':
                 raise UserError(_("This property is already sold."))
             rec.state = 'sold'
+            rec.date_sold = fields.Date.context_today(rec)
     
     @api.constrains('expected_price', 'selling_price')
     def _check_prices(self):
@@ -144,6 +185,30 @@ class EstateProperty(models.Model):
             if rec.state not in ['new', 'cancelled']:
                 raise UserError(_("You cannot delete a property that is not new or cancelled."))
 
+    def init(self):
+        super().init()
+        # the daily statistics count a sale on its date_sold: date the sales
+        # recorded without one on their last write, once and for all
+        self.env.cr.execute(
+            "UPDATE estate_property SET date_sold = write_date::date WHERE state = 'sold' AND date_sold IS NULL"
+        )
+
+    def write(self, vals):
+        if vals.get('state') == 'sold' and not vals.get('date_sold'):
+            vals = dict(vals, date_sold=fields.Date.context_today(self))
+        Stats = self.env['estate.stats.daily']
+        if {'property_type_id', 'salesperson_id'} & vals.keys():
+            # the rollups of their offers and sales move to another group
+            Stats._mark_stale_days(offer_property_ids=self.ids, sold_property_ids=self.ids)
+        elif {'state', 'date_sold'} & vals.keys():
+            Stats._mark_stale_days(sold_property_ids=self.filtered(lambda p: p.state == 'sold').ids)
+        return super().write(vals)
+
+    def unlink(self):
+        # the offers go with the property, by the database cascade
+        self.env['estate.stats.daily']._mark_stale_days(offer_property_ids=self.ids, sold_property_ids=self.ids)
+        return super().unlink()
+
 
 
 
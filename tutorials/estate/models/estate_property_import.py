@@ -0,0 +1,162 @@
+import base64
+import csv
+import datetime
+import io
+import json
+import logging
+import time
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'x'}
+FLOAT_COLUMNS = ('expected_price', 'living_area', 'garden_area')
+INT_COLUMNS = ('bedrooms', 'facades')
+BOOL_COLUMNS = ('garage', 'garden', 'active')
+CHAR_COLUMNS = ('name', 'description', 'postcode', 'garden_orientation')
+
+
+class EstatePropertyImport(models.AbstractModel):
+    _name = 'estate.property.import'
+    _description = 'Real Estate Property Bulk Import'
+
+    @api.model
+    def import_base64(self, content, file_type='csv', chunk_size=1000):
+        """RPC entry point: import a base64 encoded CSV or NDJSON file."""
+        return self.import_file(io.BytesIO(base64.b64decode(content)), file_type, chunk_size)
+
+    @api.model
+    def import_file(self, fileobj, file_type='csv', chunk_size=1000):
+        """Stream a CSV or NDJSON file of properties and create them in chunks.
+
+        Property types are referenced by name in ``property_type``, tags by
+        name in ``tags`` (comma separated in CSV, a list in NDJSON). Invalid
+        rows are skipped and reported, they never abort the import.
+        Returns a dict with the created count, the row errors and the rate.
+        """
+        start = time.time()
+        resolver = {
+            'types': {t.name: t.id for t in self.env['estate.property.type'].search([])},
+            'tags': {t.name: t.id for t in self.env['estate.property.tag'].search([])},
+            'date_availability': fields.Date.context_today(self) + datetime.timedelta(days=90),
+        }
+        report = {'rows': 0, 'created': 0, 'errors': []}
+
+        chunk = []
+        for line, row in self._iter_rows(fileobj, file_type):
+            report['rows'] += 1
+            try:
+                if file_type == 'ndjson':
+                    row = self._parse_ndjson_row(row)
+                chunk.append((line, self._prepare_import_vals(row, resolver)))
+            except (UserError, ValueError, TypeError) as e:
+                report['errors'].append((line, str(e)))
+            if len(chunk) >= chunk_size:
+                self._create_import_chunk(chunk, report)
+                chunk = []
+        if chunk:
+            self._create_import_chunk(chunk, report)
+
+        report['duration'] = time.time() - start
+        report['rows_per_sec'] = report['rows'] / report['duration'] if report['duration'] else 0.0
+        _logger.info(
+            "estate: imported %s/%s properties in %.1fs (%.0f rows/s), %s errors",
+            report['created'], report['rows'], report['duration'],
+            report['rows_per_sec'], len(report['errors']),
+        )
+        return report
+
+    @api.model
+    def _iter_rows(self, fileobj, file_type):
+        """Yield (line number, row) from the file, without loading it whole.
+
+        CSV rows are dicts; NDJSON rows are the raw lines, parsed per row by
+        _parse_ndjson_row so that a malformed line is reported like any
+        other invalid row.
+        """
+        text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        if file_type == 'csv':
+            reader = csv.DictReader(text)
+            for row in reader:
+                yield reader.line_num, row
+        elif file_type == 'ndjson':
+            for line, raw in enumerate(text, start=1):
+                if raw.strip():
+                    yield line, raw
+        else:
+            raise UserError(_("Unsupported import format: %s", file_type))
+
+    @api.model
+    def _parse_ndjson_row(self, raw):
+        row = json.loads(raw)
+        if not isinstance(row, dict):
+            raise UserError(_("Row is not a JSON object."))
+        return row
+
+    @api.model
+    def _prepare_import_vals(self, row, resolver):
+        """Convert a file row to estate.property create values."""
+        vals = {}
+        for col in CHAR_COLUMNS:
+            if row.get(col) not in (None, ''):
+                vals[col] = str(row[col]).strip()
+        for col in FLOAT_COLUMNS:
+            if row.get(col) not in (None, ''):
+                vals[col] = float(row[col])
+        for col in INT_COLUMNS:
+            if row.get(col) not in (None, ''):
+                vals[col] = int(row[col])
+        for col in BOOL_COLUMNS:
+            if row.get(col) not in (None, ''):
+                value = row[col]
+                vals[col] = value if isinstance(value, bool) else str(value).strip().lower() in TRUE_VALUES
+
+        if not vals.get('name'):
+            raise UserError(_("Missing property name."))
+        if vals.get('expected_price', 0.0) <= 0:
+            raise UserError(_("Expected price must be positive."))
+
+        type_name = row.get('property_type') or ''
+        if not isinstance(type_name, str):
+            raise UserError(_("Property type must be a name: %s", type_name))
+        type_name = type_name.strip()
+        if type_name not in resolver['types']:
+            raise UserError(_("Unknown property type: %s", type_name))
+        vals['property_type_id'] = resolver['types'][type_name]
+
+        tags = row.get('tags') or []
+        if isinstance(tags, str):
+            tags = tags.split(',')
+        if not isinstance(tags, list) or not all(isinstance(t, str) for t in tags):
+            raise UserError(_("Tags must be a list of names: %s", tags))
+        tag_ids = []
+        for tag_name in filter(None, (t.strip() for t in tags)):
+            if tag_name not in resolver['tags']:
+                resolver['tags'][tag_name] = self.env['estate.property.tag'].create({'name': tag_name}).id
+            tag_ids.append(resolver['tags'][tag_name])
+        if tag_ids:
+            vals['tag_ids'] = [fields.Command.set(tag_ids)]
+
+        date = row.get('date_availability')
+        vals['date_availability'] = fields.Date.to_date(date) if date else resolver['date_availability']
+        return vals
+
+    @api.model
+    def _create_import_chunk(self, chunk, report):
+        """Create a chunk in one call; on a database error, retry it row by row."""
+        Property = self.env['estate.property']
+        try:
+            with self.env.cr.savepoint():
+                Property.create([vals for _line, vals in chunk])
+            report['created'] += len(chunk)
+        except Exception:
+            for line, vals in chunk:
+                try:
+                    with self.env.cr.savepoint():
+                        Property.create(vals)
+                    report['created'] += 1
+                except Exception as e:
+                    report['errors'].append((line, str(e)))
+        # keep memory flat on large files
+        self.env.invalidate_all()
@@ -1,7 +1,12 @@
 import datetime
-from odoo import models, fields, api, _, SUPERUSER_ID
+import logging
+import time
+from collections import defaultdict
+from odoo import models, fields, api, tools, _, SUPERUSER_ID
 from odoo.exceptions import UserError, ValidationError
 
+_logger = logging.getLogger(__name__)
+
 class EstatePropertyOffer(models.Model):
     _name = 'estate.property.offer'
     _description = 'Estate Property Offer'
@@ -45,31 +50,80 @@ class EstatePropertyOffer(models.Model):
         compute_sudo=True,
     )
 
+    def init(self):
+        # serves the expiry cron: draft offers past their deadline
+        tools.create_index(
+            self._cr, 'estate_property_offer_status_date_deadline_idx',
+            self._table, ['status', 'date_deadline'],
+        )
+
     @api.model_create_multi
     def create(self, vals_list):
         Property = self.env['estate.property']
-        for vals in vals_list:
-            prop_id = vals.get('property_id')
-            if prop_id:
-                # find the highest existing price for this property
-                existing_max = self.search_read(
-                    [('property_id', '=', prop_id)],
-                    ['price'],
-                    limit=1,
-                    order='price desc',
-                )
-                if existing_max and vals.get('price', 0.0) <= existing_max[0]['price']:
+        prop_ids = sorted({v['property_id'] for v in vals_list if v.get('property_id')})
+        if prop_ids:
+            # lock the target properties so concurrent bidders cannot both pass the check
+            Property.browse(prop_ids)._lock_for_offers()
+            best_prices = self._get_max_prices(prop_ids)
+            for vals in vals_list:
+                prop_id = vals.get('property_id')
+                if not prop_id:
+                    continue
+                price = vals.get('price', 0.0)
+                # compare against existing offers and the ones earlier in this batch
+                if prop_id in best_prices and price <= best_prices[prop_id]:
                     raise ValidationError(_("Offer price must be strictly higher than existing offers."))
+                best_prices[prop_id] = price
 
         records = super().create(vals_list)
 
-        # set the state on all affected properties
-        props = Property.browse(list({v.get('property_id') for v in vals_list if v.get('property_id')}))
+        # set the state and best price on all affected properties
+        props = Property.browse(prop_ids).with_user(SUPERUSER_ID)
         if props:
-            props.with_user(SUPERUSER_ID).write({'state': 'offer_received'})
+            props.write({'state': 'offer_received'})
+            props._update_best_price(best_prices)
 
         return records
 
+    def write(self, vals):
+        if not {'price', 'property_id', 'status'} & vals.keys():
+            return super().write(vals)
+
+        if 'property_id' in vals or 'status' in vals:
+            rescan = self.property_id
+            raised = self.env['estate.property']
+        else:
+            # a price drop may dethrone the best offer, a raise never does;
+            # refused offers do not count towards best_price at all
+            live = self.filtered(lambda o: o.status != 'refused')
+            rescan = live.filtered(lambda o: o.price > vals['price']).property_id
+            raised = live.property_id - rescan
+
+        res = super().write(vals)
+
+        if 'property_id' in vals:
+            rescan |= self.property_id
+        rescan.with_user(SUPERUSER_ID)._recompute_best_price()
+        raised.with_user(SUPERUSER_ID)._update_best_price(dict.fromkeys(raised.ids, vals.get('price', 0.0)))
+        return res
+
+    def unlink(self):
+        props = self.property_id
+        self.env['estate.stats.daily']._mark_stale_days(offer_ids=self.ids)
+        res = super().unlink()
+        props.with_user(SUPERUSER_ID)._recompute_best_price()
+        return res
+
+    @api.model
+    def _get_max_prices(self, property_ids):
+        """Return {property_id: highest live offer price} in a single grouped query."""
+        groups = self.sudo()._read_group(
+            [('property_id', 'in', list(property_ids)), ('status', '!=', 'refused')],
+            ['property_id'],
+            ['price:max'],
+        )
+        return {prop.id: max_price for prop, max_price in groups}
+
     @api.depends('create_date', 'validity')
     def _compute_date_deadline(self):
         for rec in self:
@@ -84,6 +138,47 @@ class EstatePropertyOffer(models.Model):
             else:
                 rec.validity = 0
 
+    @api.model
+    def _cron_expire_offers(self, batch_size=1000, dry_run=False, auto_commit=True):
+        """Refuse draft offers past their deadline, one committed chunk at a time.
+
+        With ``dry_run`` nothing is written, only the pending counts are reported.
+        Returns a dict with the counts and the elapsed time.
+        """
+        start = time.time()
+        domain = [('status', '=', 'draft'), ('date_deadline', '<', fields.Date.context_today(self))]
+
+        if dry_run:
+            groups = self._read_group(domain, ['property_id'], ['__count'])
+            offers = sum(count for _prop, count in groups)
+            result = {
+                'offers': offers,
+                'properties': len(groups),
+                'chunks': -(-offers // batch_size),
+                'duration': time.time() - start,
+            }
+            _logger.info("estate: offer expiry dry run: %s", result)
+            return result
+
+        result = {'offers': 0, 'properties': 0, 'chunks': 0}
+        while True:
+            offers = self.search(domain, limit=batch_size, order='id')
+            if not offers:
+                break
+            props = offers.property_id
+            # refusing rescans best_price and state of the affected properties
+            offers.write({'status': 'refused'})
+            result['offers'] += len(offers)
+            result['properties'] += len(props)
+            result['chunks'] += 1
+            if auto_commit:
+                self.env.cr.commit()
+            self.env.invalidate_all()
+
+        result['duration'] = time.time() - start
+        _logger.info("estate: offer expiry done: %s", result)
+        return result
+
     # Action methods
     def action_accept(self):
         self.ensure_one()
@@ -105,5 +200,67 @@ class EstatePropertyOffer(models.Model):
             if rec.status != 'accepted':
                 rec.status = 'refused'
 
+    def action_accept_batch(self):
+        """Accept many offers at once, grouped by property.
+
+        Conflicting offers are reported instead of aborting the batch.
+        Returns a list of ``{'offer_id', 'success', 'message'}`` dicts.
+        """
+        report = {}
+        by_property = defaultdict(lambda: self.browse())
+        for rec in self:
+            by_property[rec.property_id] |= rec
+
+        props = self.property_id
+        already_accepted = set(self.search([
+            ('property_id', 'in', props.ids),
+            ('status', '=', 'accepted'),
+        ]).property_id.ids)
+
+        to_accept = self.browse()
+        for prop, offers in by_property.items():
+            if prop.id in already_accepted:
+                message = _("This property already has an accepted offer.")
+            elif len(offers) > 1:
+                message = _("Several offers of this batch target the same property.")
+            # same rule as EstateProperty._check_prices
+            elif offers.price < prop.expected_price * 0.9:
+                message = _("Selling price must be at least 90% of the expected price.")
+            else:
+                to_accept |= offers
+                continue
+            for rec in offers:
+                report[rec.id] = message
+
+        if to_accept:
+            to_accept.write({'status': 'accepted'})
+            self.search([
+                ('property_id', 'in', to_accept.property_id.ids),
+                ('id', 'not in', to_accept.ids),
+                ('status', '!=', 'refused'),
+            ]).write({'status': 'refused'})
+            # one property write per distinct (selling price, buyer)
+            by_values = defaultdict(lambda: self.env['estate.property'])
+            for rec in to_accept:
+                by_values[rec.price, rec.partner_id.id] |= rec.property_id
+            for (price, partner_id), props in by_values.items():
+                props.write({'state': 'offer_accepted', 'selling_price': price, 'buyer_id': partner_id})
+
+        return self._batch_report(report)
+
+    def action_refuse_batch(self):
+        """Refuse many offers at once; accepted offers are reported and left untouched.
+
+        Returns a list of ``{'offer_id', 'success', 'message'}`` dicts.
+        """
+        accepted = self.filtered(lambda o: o.status == 'accepted')
+        (self - accepted).filtered(lambda o: o.status != 'refused').write({'status': 'refused'})
+        report = dict.fromkeys(accepted.ids, _("An accepted offer cannot be refused."))
+        return self._batch_report(report)
 
-    
\ No newline at end of file
+    def _batch_report(self, errors):
+        """Build the per-offer result of a batch action from {offer_id: error message}."""
+        return [
+            {'offer_id': rec.id, 'success': rec.id not in errors, 'message': errors.get(rec.id, '')}
+            for rec in self
+        ]
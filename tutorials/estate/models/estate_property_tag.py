@@ -11,17 +11,31 @@ class EstatePropertyTag(models.Model):
     name = fields.Char(string='Name', required=True)
     color = fields.Integer(string="Color")
     
+    property_ids = fields.Many2many(
+        'estate.property',
+        'estate_property_estate_property_tag_rel',
+        'estate_property_tag_id',
+        'estate_property_id',
+        string='Tagged Properties',
+    )
     property_count = fields.Integer(
         string='Properties',
         compute='_compute_property_count',
+        store=True,
         help="Number of properties associated with this tag",
         compute_sudo=True
     )
 
+    @api.depends('property_ids', 'property_ids.active')
     def _compute_property_count(self):
-        Property = self.env['estate.property']
+        counts = self.env['estate.property']._read_group(
+            [('tag_ids', 'in', self.ids)],
+            ['tag_ids'],
+            ['__count'],
+        )
+        by_tag = {tag.id: count for tag, count in counts}
         for rec in self:
-            rec.property_count = Property.search_count([('tag_ids', 'in', rec.id)])
+            rec.property_count = by_tag.get(rec.id, 0)
 
     def action_open_properties(self):
         self.ensure_one()
@@ -18,6 +18,8 @@ class EstatePropertyType(models.Model):
         string='Offers',
     )
 
+    # not stored: a stored count would update the shared type row on every
+    # offer, making concurrent bids on properties of the same type collide
     offer_count = fields.Integer(
         compute='_compute_offer_count',
         string='Offer Count',
@@ -58,7 +60,14 @@ class EstatePropertyType(models.Model):
             'context': {'default_property_type_id': self.id},
         }
     
+    @api.depends('offer_ids')
     def _compute_offer_count(self):
+        counts = self.env['estate.property.offer']._read_group(
+            [('property_type_id', 'in', self.ids)],
+            ['property_type_id'],
+            ['__count'],
+        )
+        by_type = {ptype.id: count for ptype, count in counts}
         for rec in self:
-            rec.offer_count = len(rec.offer_ids)
+            rec.offer_count = by_type.get(rec.id, 0)
 
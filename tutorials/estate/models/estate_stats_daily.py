@@ -0,0 +1,156 @@
+import datetime
+import logging
+from odoo import models, fields, api
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+WATERMARK_PARAM = 'estate.stats_daily_watermark'
+# transactions still running at refresh time commit write_dates older than the
+# watermark: re-scan that margin, the refresh of a day is idempotent
+WATERMARK_OVERLAP = datetime.timedelta(minutes=10)
+# days queued for the next refresh by the changes the watermark cannot see
+STALE_DAYS_TABLE = 'estate_stats_daily_stale'
+
+
+class EstateStatsDaily(models.Model):
+    _name = 'estate.stats.daily'
+    _description = 'Real Estate Daily Statistics'
+    _order = 'date desc'
+    _log_access = False
+
+    date = fields.Date(string='Date', required=True, index=True, readonly=True)
+    property_type_id = fields.Many2one('estate.property.type', string='Property Type', readonly=True)
+    salesperson_id = fields.Many2one('res.users', string='Salesperson', readonly=True)
+    offer_count = fields.Integer(string='Offers', readonly=True)
+    offer_amount = fields.Float(string='Offers Amount', readonly=True)
+    max_price = fields.Float(string='Max Offer Price', aggregator='max', readonly=True)
+    avg_price = fields.Float(string='Average Offer Price', aggregator='avg', readonly=True)
+    sold_count = fields.Integer(string='Properties Sold', readonly=True)
+    revenue = fields.Float(string='Revenue', readonly=True)
+
+    def init(self):
+        self.env.cr.execute(SQL(
+            "CREATE TABLE IF NOT EXISTS %s (date date PRIMARY KEY)",
+            SQL.identifier(STALE_DAYS_TABLE),
+        ))
+
+    @api.model
+    def _mark_stale_days(self, offer_ids=(), offer_property_ids=(), sold_property_ids=()):
+        """Queue days for the next refresh, whatever the write_date of their records.
+
+        Deleted offers and properties, and properties moved to another type
+        or salesperson, leave no trace the watermark would see. Queued are
+        the creation days of the given offers and of the offers of
+        ``offer_property_ids``, and the sale day of ``sold_property_ids``.
+        """
+        if not (offer_ids or offer_property_ids or sold_property_ids):
+            return
+        self.env['estate.property.offer'].flush_model(['property_id'])
+        self.env['estate.property'].flush_model(['state', 'date_sold'])
+        self.env.cr.execute(SQL(
+            """
+            INSERT INTO %(stale)s (date)
+            SELECT date FROM (
+                SELECT create_date::date AS date FROM estate_property_offer
+                 WHERE id = ANY(%(offer_ids)s) OR property_id = ANY(%(offer_property_ids)s)
+                 UNION
+                SELECT date_sold FROM estate_property
+                 WHERE id = ANY(%(sold_property_ids)s) AND state = 'sold'
+            ) days
+             WHERE date IS NOT NULL
+            ON CONFLICT DO NOTHING
+            """,
+            stale=SQL.identifier(STALE_DAYS_TABLE),
+            offer_ids=list(offer_ids),
+            offer_property_ids=list(offer_property_ids),
+            sold_property_ids=list(sold_property_ids),
+        ))
+
+    @api.model
+    def _cron_refresh(self, full=False):
+        """Recompute the rollups of the days touched since the last run.
+
+        Offers count on the day they were created, sales on the day the
+        property was sold. Days queued by _mark_stale_days are recomputed
+        too. ``full`` rebuilds every day.
+        """
+        cr = self.env.cr
+        self.env.flush_all()
+        cr.execute("SELECT (now() AT TIME ZONE 'UTC')")
+        now = cr.fetchone()[0]
+
+        watermark = self.env['ir.config_parameter'].sudo().get_param(WATERMARK_PARAM)
+        since = None if full or not watermark else fields.Datetime.to_datetime(watermark) - WATERMARK_OVERLAP
+
+        cr.execute(SQL(
+            """
+            SELECT create_date::date FROM estate_property_offer WHERE %(offer_filter)s
+             UNION
+            SELECT date_sold FROM estate_property
+             WHERE state = 'sold' AND %(property_filter)s
+            """,
+            offer_filter=SQL("write_date > %s", since) if since else SQL("TRUE"),
+            property_filter=SQL("write_date > %s", since) if since else SQL("TRUE"),
+        ))
+        days = {day for day, in cr.fetchall() if day}
+        cr.execute(SQL("DELETE FROM %s RETURNING date", SQL.identifier(STALE_DAYS_TABLE)))
+        if not full:
+            days.update(day for day, in cr.fetchall())
+        days = tuple(days)
+
+        if full:
+            cr.execute(SQL("DELETE FROM %s", SQL.identifier(self._table)))
+        if days:
+            self._refresh_days(days)
+
+        self.env['ir.config_parameter'].sudo().set_param(WATERMARK_PARAM, fields.Datetime.to_string(now))
+        self.env.invalidate_all()
+        _logger.info("estate: daily statistics refreshed for %s day(s)", len(days))
+        return len(days)
+
+    @api.model
+    def _refresh_days(self, days):
+        """Replace the rollup rows of the given days."""
+        start = min(days)
+        end = max(days) + datetime.timedelta(days=1)
+        self.env.cr.execute(SQL(
+            """
+            DELETE FROM %(table)s WHERE date IN %(days)s;
+
+            WITH offers AS (
+                SELECT o.create_date::date AS date, p.property_type_id, p.salesperson_id,
+                       COUNT(*) AS offer_count, SUM(o.price) AS offer_amount,
+                       MAX(o.price) AS max_price, AVG(o.price) AS avg_price
+                  FROM estate_property_offer o
+                  JOIN estate_property p ON p.id = o.property_id
+                 WHERE o.create_date >= %(start)s AND o.create_date < %(end)s
+                   AND o.create_date::date IN %(days)s
+                 GROUP BY 1, 2, 3
+            ), sales AS (
+                SELECT p.date_sold AS date, p.property_type_id, p.salesperson_id,
+                       COUNT(*) AS sold_count, SUM(p.selling_price) AS revenue
+                  FROM estate_property p
+                 WHERE p.state = 'sold'
+                   AND p.date_sold IN %(days)s
+                 GROUP BY 1, 2, 3
+            )
+            INSERT INTO %(table)s (date, property_type_id, salesperson_id,
+                                   offer_count, offer_amount, max_price, avg_price, sold_count, revenue)
+            SELECT COALESCE(o.date, s.date),
+                   COALESCE(o.property_type_id, s.property_type_id),
+                   COALESCE(o.salesperson_id, s.salesperson_id),
+                   COALESCE(o.offer_count, 0), COALESCE(o.offer_amount, 0),
+                   COALESCE(o.max_price, 0), COALESCE(o.avg_price, 0),
+                   COALESCE(s.sold_count, 0), COALESCE(s.revenue, 0)
+              FROM offers o
+              FULL JOIN sales s
+                ON s.date = o.date
+               AND s.property_type_id = o.property_type_id
+               AND s.salesperson_id IS NOT DISTINCT FROM o.salesperson_id
+            """,
+            table=SQL.identifier(self._table),
+            days=days,
+            start=start,
+            end=end,
+        ))
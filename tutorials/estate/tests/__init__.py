@@ -0,0 +1,5 @@
+from . import test_estate_offer
+from . import test_estate_bid_concurrency
+from . import test_estate_import
+from . import test_estate_stats
+from . import test_estate_benchmark
\ No newline at end of file
@@ -0,0 +1,32 @@
+from odoo.tests import TransactionCase
+
+
+class EstateTestCommon(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Property = cls.env['estate.property']
+        cls.Offer = cls.env['estate.property.offer']
+        cls.property_type = cls.env['estate.property.type'].create({'name': 'House'})
+        cls.partner = cls.env['res.partner'].create({'name': 'Bidder'})
+
+    @classmethod
+    def _create_properties(cls, count, **vals):
+        return cls.Property.create([
+            {
+                'name': f'Property {i}',
+                'property_type_id': cls.property_type.id,
+                'expected_price': 100000.0,
+                **vals,
+            }
+            for i in range(count)
+        ])
+
+    def _count_queries(self, func):
+        """Run ``func`` and return (its result, the number of queries it issued, flush included)."""
+        self.env.flush_all()
+        start = self.env.cr.sql_log_count
+        result = func()
+        self.env.flush_all()
+        return result, self.env.cr.sql_log_count - start
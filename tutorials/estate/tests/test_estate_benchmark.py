@@ -0,0 +1,62 @@
+import logging
+import time
+
+from odoo.tests import tagged
+
+from .common import EstateTestCommon
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged('-standard', 'estate_benchmark')
+class TestEstateBenchmark(EstateTestCommon):
+    """Benchmarks, run on demand with ``--test-tags estate_benchmark``."""
+
+    def _report(self, name, queries, duration, **extra):
+        details = ''.join(f', {key}={value}' for key, value in extra.items())
+        _logger.info("estate benchmark %s: %s queries in %.2fs%s", name, queries, duration, details)
+
+    def test_offer_create_10k_offers_1k_properties(self):
+        props = self._create_properties(1000)
+        vals_list = [
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 1000.0 + i}
+            for i in range(10)
+            for prop in props
+        ]
+
+        # one create per offer: the N round-trips of the former validation
+        single = vals_list[:1000]
+        start = time.time()
+        _offers, queries = self._count_queries(lambda: [self.Offer.create(vals) for vals in single])
+        self._report('offer create (one per call)', queries, time.time() - start, offers=len(single))
+
+        # the remaining 9k offers in one batch
+        batch = vals_list[1000:]
+        start = time.time()
+        offers, queries = self._count_queries(lambda: self.Offer.create(batch))
+        self._report('offer create (batched)', queries, time.time() - start, offers=len(batch))
+
+        self.assertEqual(len(offers), len(batch))
+        self.assertEqual(set(props.mapped('best_price')), {1009.0})
+
+    def test_bid_throughput_on_1k_offers(self):
+        prop = self._create_properties(1)
+        self.Offer.create([
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 1000.0 + i}
+            for i in range(1000)
+        ])
+        self.env.invalidate_all()
+
+        bids = 200
+        price = prop.best_price
+        start = time.time()
+
+        def place_bids():
+            for i in range(1, bids + 1):
+                prop._place_bid(self.partner, price + i)
+
+        _result, queries = self._count_queries(place_bids)
+        duration = time.time() - start
+        self._report('bids on a property with 1k offers', queries, duration,
+                     bids=bids, bids_per_second=round(bids / duration), queries_per_bid=queries / bids)
+        self.assertEqual(prop.best_price, price + bids)
@@ -0,0 +1,121 @@
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from psycopg2.errors import SerializationFailure
+
+from odoo import SUPERUSER_ID, api
+from odoo.exceptions import ValidationError
+from odoo.modules.registry import Registry
+from odoo.tests import BaseCase, get_db_name, tagged
+
+_logger = logging.getLogger(__name__)
+
+BIDDERS = 8
+BIDS = 200
+
+
+@tagged('post_install', '-at_install')
+class TestConcurrentBids(BaseCase):
+    """Bids placed from separate cursors, committed like concurrent requests.
+
+    The data is committed for real (the other cursors must see it) and
+    removed at the end of the test.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.registry = Registry(get_db_name())
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            property_type = env['estate.property.type'].create({'name': 'Concurrent bids'})
+            self.partner_id = env['res.partner'].create({'name': 'Concurrent bidder'}).id
+            # listings of the same type, one per bidder for the parallel auctions
+            self.property_ids = env['estate.property'].create([
+                {
+                    'name': f'Auction {i}',
+                    'property_type_id': property_type.id,
+                    'expected_price': 100000.0,
+                }
+                for i in range(BIDDERS)
+            ]).ids
+            self.property_id = self.property_ids[0]
+            self.type_id = property_type.id
+        self.serialization_failures = []
+        self.addCleanup(self._cleanup)
+
+    def _cleanup(self):
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            props = env['estate.property'].browse(self.property_ids)
+            props.offer_ids.unlink()
+            props.write({'state': 'cancelled'})
+            props.unlink()
+            env['estate.property.type'].browse(self.type_id).unlink()
+            env['res.partner'].browse(self.partner_id).unlink()
+
+    def _bid(self, amount, property_id=None):
+        """Place a bid in its own transaction, retried on serialization errors
+        like the HTTP layer does. Returns whether the bid was accepted."""
+        for _attempt in range(100):
+            try:
+                with self.registry.cursor() as cr:
+                    env = api.Environment(cr, SUPERUSER_ID, {})
+                    env['estate.property'].browse(property_id or self.property_id)._place_bid(
+                        env['res.partner'].browse(self.partner_id), amount)
+                return True
+            except ValidationError:
+                return False
+            except SerializationFailure:
+                self.serialization_failures.append(amount)
+                time.sleep(random.uniform(0, 0.01))
+        raise AssertionError(f"bid {amount} kept failing to serialize")
+
+    def test_concurrent_bids(self):
+        amounts = [float(amount) for amount in range(1, BIDS + 1)]
+        random.shuffle(amounts)
+
+        start = time.time()
+        with ThreadPoolExecutor(BIDDERS) as pool:
+            accepted = [amount for amount, ok in zip(amounts, pool.map(self._bid, amounts)) if ok]
+        duration = time.time() - start
+
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            prop = env['estate.property'].browse(self.property_id)
+            prices = prop.offer_ids.sorted('id').mapped('price')
+
+            # no lost update: every accepted bid is an offer, and only those
+            self.assertEqual(sorted(prices), sorted(accepted))
+            # serialized: each offer beats every offer placed before it
+            self.assertEqual(prices, sorted(set(prices)), "offer prices must be strictly increasing")
+            self.assertEqual(prop.best_price, float(BIDS))
+            self.assertEqual(prop.state, 'offer_received')
+        _logger.info("estate: %s concurrent bids (%s accepted) in %.2fs, %.0f bids/s",
+                     BIDS, len(accepted), duration, BIDS / duration)
+
+    def test_concurrent_bids_on_listings_of_one_type(self):
+        """Bids on different properties do not contend, even when they share their type."""
+        bids = [
+            (float(amount), property_id)
+            for amount in range(1, BIDS // BIDDERS + 1)
+            for property_id in self.property_ids
+        ]
+
+        def bid_series(property_id):
+            return all(self._bid(amount, prop_id) for amount, prop_id in bids if prop_id == property_id)
+
+        start = time.time()
+        with ThreadPoolExecutor(BIDDERS) as pool:
+            results = list(pool.map(bid_series, self.property_ids))
+        duration = time.time() - start
+
+        self.assertTrue(all(results))
+        self.assertEqual(self.serialization_failures, [], "bids on distinct listings must not collide")
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            props = env['estate.property'].browse(self.property_ids)
+            self.assertEqual(set(props.mapped('best_price')), {float(BIDS // BIDDERS)})
+        _logger.info("estate: %s bids on %s listings of one type in %.2fs, %.0f bids/s",
+                     len(bids), BIDDERS, duration, len(bids) / duration)
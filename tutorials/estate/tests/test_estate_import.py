@@ -0,0 +1,50 @@
+import io
+
+from .common import EstateTestCommon
+from odoo.tests import tagged
+
+
+@tagged('post_install', '-at_install')
+class TestEstateImport(EstateTestCommon):
+
+    def _import(self, content, file_type):
+        return self.env['estate.property.import'].import_file(
+            io.BytesIO(content.encode()), file_type, chunk_size=2)
+
+    def test_import_ndjson_reports_bad_rows(self):
+        content = '\n'.join([
+            '{"name": "Villa", "expected_price": 1000, "property_type": "House", "tags": ["Sea"]}',
+            '{"name": "Broken", ',
+            '[1, 2, 3]',
+            '"just a string"',
+            '{"name": "Flat", "expected_price": 500, "property_type": "House"}',
+            '{"name": "Nowhere", "expected_price": 500, "property_type": "Castle"}',
+            '{"name": "Loft", "expected_price": 800, "property_type": "House"}',
+            '{"name": "Typed", "expected_price": 800, "property_type": 5}',
+            '{"name": "Tagged", "expected_price": 800, "property_type": "House", "tags": [1]}',
+            '{"name": "Tag object", "expected_price": 800, "property_type": "House", "tags": {"Sea": 1}}',
+            '{"name": "Priced", "expected_price": {"amount": 800}, "property_type": "House"}',
+            '{"name": "Dated", "expected_price": 800, "property_type": "House", "date_availability": 5}',
+        ])
+        report = self._import(content, 'ndjson')
+
+        self.assertEqual(report['rows'], 12)
+        self.assertEqual(report['created'], 3)
+        self.assertEqual([line for line, _error in report['errors']], [2, 3, 4, 6, 8, 9, 10, 11, 12])
+        props = self.Property.search([('name', 'in', ['Villa', 'Flat', 'Loft'])])
+        self.assertEqual(len(props), 3)
+        self.assertEqual(props.filtered(lambda p: p.name == 'Villa').tag_ids.name, 'Sea')
+
+    def test_import_csv(self):
+        content = (
+            'name,expected_price,property_type,tags,garden\n'
+            'Villa,1000,House,"Sea,Garden",yes\n'
+            'Cheap,-5,House,,\n'
+            'Flat,500,House,,no\n'
+        )
+        report = self._import(content, 'csv')
+        self.assertEqual(report['created'], 2)
+        self.assertEqual([line for line, _error in report['errors']], [3])
+        villa = self.Property.search([('name', '=', 'Villa')])
+        self.assertTrue(villa.garden)
+        self.assertEqual(sorted(villa.tag_ids.mapped('name')), ['Garden', 'Sea'])
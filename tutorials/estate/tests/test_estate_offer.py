@@ -0,0 +1,166 @@
+import datetime
+
+from odoo import fields
+from odoo.exceptions import ValidationError
+from odoo.tests import tagged
+
+from .common import EstateTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestEstateOffer(EstateTestCommon):
+
+    def test_create_checks_earlier_offers_of_the_batch(self):
+        prop = self._create_properties(1)
+        self.Offer.create([
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 100.0},
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 200.0},
+        ])
+        self.assertEqual(prop.best_price, 200.0)
+        self.assertEqual(prop.state, 'offer_received')
+
+        with self.assertRaises(ValidationError):
+            self.Offer.create([
+                {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 300.0},
+                {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 250.0},
+            ])
+
+    def test_create_checks_existing_offers(self):
+        prop = self._create_properties(1)
+        self.Offer.create({'property_id': prop.id, 'partner_id': self.partner.id, 'price': 500.0})
+        with self.assertRaises(ValidationError):
+            self.Offer.create({'property_id': prop.id, 'partner_id': self.partner.id, 'price': 500.0})
+
+    def test_create_query_count_does_not_grow_with_offers(self):
+        """The price validation costs one grouped query and one lock per batch, not per offer."""
+        small, large = self._create_properties(2)
+
+        def create_offers(prop, count):
+            return lambda: self.Offer.create([
+                {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 1000.0 + i}
+                for i in range(count)
+            ])
+
+        _offers, queries_small = self._count_queries(create_offers(small, 10))
+        _offers, queries_large = self._count_queries(create_offers(large, 500))
+        # only the batched INSERTs may grow with the batch size
+        self.assertLessEqual(queries_large - queries_small, 5)
+        self.assertEqual(large.best_price, 1499.0)
+
+    def test_best_price_incremental(self):
+        prop = self._create_properties(1)
+        low, high = self.Offer.create([
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 100.0},
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 200.0},
+        ])
+        low.price = 300.0
+        self.assertEqual(prop.best_price, 300.0)
+        # a price drop rescans the live offers
+        low.price = 150.0
+        self.assertEqual(prop.best_price, 200.0)
+        high.unlink()
+        self.assertEqual(prop.best_price, 150.0)
+        low.unlink()
+        self.assertEqual(prop.best_price, 0.0)
+        self.assertEqual(prop.state, 'new')
+
+    def test_bid_cost_does_not_depend_on_existing_offers(self):
+        """A new bid compares to the stored best_price, it never reloads the other offers."""
+        few, many = self._create_properties(2)
+        for prop, count in ((few, 5), (many, 500)):
+            self.Offer.create([
+                {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 1000.0 + i}
+                for i in range(count)
+            ])
+        self.env.invalidate_all()
+
+        _offer, queries_few = self._count_queries(lambda: few._place_bid(self.partner, 5000.0))
+        _offer, queries_many = self._count_queries(lambda: many._place_bid(self.partner, 5000.0))
+        self.assertEqual(queries_few, queries_many)
+
+    def test_accept_batch(self):
+        props = self._create_properties(3)
+        offers = self.Offer.create([
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': price}
+            for prop in props
+            for price in (95000.0, 96000.0)
+        ])
+        best = offers.filtered(lambda o: o.price == 96000.0)
+        # the first property gets two offers of the batch: a conflict
+        batch = best | offers.filtered(lambda o: o.property_id == props[0])
+
+        report = {r['offer_id']: r for r in batch.action_accept_batch()}
+
+        self.assertFalse(report[best[0].id]['success'])
+        self.assertTrue(all(report[o.id]['success'] for o in best[1:]))
+        self.assertEqual(props[0].state, 'offer_received')
+        self.assertEqual(props[1:].mapped('state'), ['offer_accepted', 'offer_accepted'])
+        self.assertEqual(props[1:].mapped('selling_price'), [96000.0, 96000.0])
+        self.assertEqual(props[1:].buyer_id, self.partner)
+        self.assertEqual((offers - batch).mapped('status'), ['refused', 'refused'])
+
+    def test_accept_batch_writes_properties_per_distinct_value(self):
+        props = self._create_properties(50)
+        offers = self.Offer.create([
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 95000.0}
+            for prop in props
+        ])
+        _report, queries = self._count_queries(offers.action_accept_batch)
+        # properties sharing a selling price and buyer are written together
+        self.assertLess(queries, 25)
+
+    def test_refused_offer_price_change_keeps_best_price(self):
+        prop = self._create_properties(1)
+        refused, live = self.Offer.create([
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 100.0},
+            {'property_id': prop.id, 'partner_id': self.partner.id, 'price': 200.0},
+        ])
+        refused.status = 'refused'
+        refused.price = 500.0
+        self.assertEqual(prop.best_price, 200.0)
+        live.status = 'refused'
+        self.assertEqual(prop.best_price, 0.0)
+
+    def _create_offers_for_expiry(self):
+        """Properties A (all offers expired), B (one expired, one valid), C (valid)."""
+        prop_a, prop_b, prop_c = self._create_properties(3, expected_price=100.0)
+        offers = self.Offer.create([
+            {'property_id': prop_a.id, 'partner_id': self.partner.id, 'price': 100.0},
+            {'property_id': prop_a.id, 'partner_id': self.partner.id, 'price': 200.0},
+            {'property_id': prop_b.id, 'partner_id': self.partner.id, 'price': 100.0},
+            {'property_id': prop_b.id, 'partner_id': self.partner.id, 'price': 300.0},
+            {'property_id': prop_c.id, 'partner_id': self.partner.id, 'price': 500.0},
+        ])
+        expired = offers[:3]
+        expired.write({'date_deadline': fields.Date.today() - datetime.timedelta(days=1)})
+        return (prop_a, prop_b, prop_c), expired, offers - expired
+
+    def test_expire_offers_dry_run(self):
+        props, expired, valid = self._create_offers_for_expiry()
+        result = self.Offer._cron_expire_offers(batch_size=2, dry_run=True, auto_commit=False)
+        self.assertEqual((result['offers'], result['properties'], result['chunks']), (3, 2, 2))
+        self.assertEqual(set((expired | valid).mapped('status')), {'draft'})
+        self.assertEqual(props[0].best_price, 200.0)
+
+    def test_expire_offers(self):
+        (prop_a, prop_b, prop_c), expired, valid = self._create_offers_for_expiry()
+        result = self.Offer._cron_expire_offers(batch_size=2, auto_commit=False)
+        self.assertEqual((result['offers'], result['properties'], result['chunks']), (3, 2, 2))
+
+        self.assertEqual(set(expired.mapped('status')), {'refused'})
+        self.assertEqual(set(valid.mapped('status')), {'draft'})
+        # no live offer left on A, B falls back to its valid offer
+        self.assertEqual((prop_a.best_price, prop_a.state), (0.0, 'new'))
+        self.assertEqual((prop_b.best_price, prop_b.state), (300.0, 'offer_received'))
+        self.assertEqual((prop_c.best_price, prop_c.state), (500.0, 'offer_received'))
+
+        # nothing left to expire
+        result = self.Offer._cron_expire_offers(batch_size=2, auto_commit=False)
+        self.assertEqual((result['offers'], result['chunks']), (0, 0))
+
+    def test_expire_offers_keeps_decided_offers(self):
+        (prop_a, _prop_b, _prop_c), expired, _valid = self._create_offers_for_expiry()
+        expired[1].action_accept()
+        self.Offer._cron_expire_offers(auto_commit=False)
+        self.assertEqual(expired[1].status, 'accepted')
+        self.assertEqual(prop_a.state, 'offer_accepted')
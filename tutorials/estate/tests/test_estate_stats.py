@@ -0,0 +1,83 @@
+import datetime
+
+from odoo import fields
+from odoo.tests import tagged
+
+from .common import EstateTestCommon
+
+
+@tagged('post_install', '-at_install')
+class TestEstateStatsDaily(EstateTestCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Stats = cls.env['estate.stats.daily']
+        cls.other_type = cls.env['estate.property.type'].create({'name': 'Flat'})
+        cls.props = cls._create_properties(2)
+        cls.offers = cls.Offer.create([
+            {'property_id': prop.id, 'partner_id': cls.partner.id, 'price': price}
+            for prop in cls.props
+            for price in (1000.0, 2000.0)
+        ])
+        cls.Stats._cron_refresh(full=True)
+
+    def _offer_counts(self):
+        return {
+            ptype.name: count
+            for ptype, count in self.Stats._read_group([], ['property_type_id'], ['offer_count:sum'])
+        }
+
+    def test_refresh_after_offer_unlink(self):
+        self.assertEqual(self._offer_counts(), {'House': 4})
+        self.offers.filtered(lambda o: o.price == 2000.0).unlink()
+        self.Stats._cron_refresh()
+        self.assertEqual(self._offer_counts(), {'House': 2})
+
+    def test_refresh_after_property_unlink(self):
+        self.props[0].action_cancel()
+        self.props[0].unlink()
+        self.Stats._cron_refresh()
+        self.assertEqual(self._offer_counts(), {'House': 2})
+
+    def test_refresh_after_type_change(self):
+        self.props[1].property_type_id = self.other_type
+        self.Stats._cron_refresh()
+        self.assertEqual(self._offer_counts(), {'House': 2, 'Flat': 2})
+
+    def test_refresh_after_salesperson_change(self):
+        user = self.env['res.users'].create({'name': 'Agent', 'login': 'estate_stats_agent'})
+        self.props.salesperson_id = user
+        self.Stats._cron_refresh()
+        groups = self.Stats._read_group([], ['salesperson_id'], ['offer_count:sum'])
+        self.assertEqual([(salesperson, count) for salesperson, count in groups], [(user, 4)])
+
+    def _revenue_by_day(self):
+        return {
+            day: revenue
+            for day, revenue in self.Stats._read_group([('sold_count', '>', 0)], ['date:day'], ['revenue:sum'])
+        }
+
+    def test_sale_stays_on_its_day(self):
+        prop = self.props[0]
+        sale_day = fields.Date.today() - datetime.timedelta(days=30)
+        prop.write({'state': 'sold', 'date_sold': sale_day, 'selling_price': prop.expected_price})
+        self.Stats._cron_refresh()
+        revenue = {sale_day: prop.expected_price}
+        self.assertEqual(self._revenue_by_day(), revenue)
+
+        # a later edit does not move the sale to the day of the edit
+        prop.description = 'Sold last month'
+        self.Stats._cron_refresh()
+        self.assertEqual(self._revenue_by_day(), revenue)
+
+    def test_sold_without_date_is_dated(self):
+        prop = self.props[0]
+        prop.state = 'sold'
+        self.assertEqual(prop.date_sold, fields.Date.context_today(prop))
+
+        self.env.flush_all()
+        self.env.cr.execute("UPDATE estate_property SET date_sold = NULL WHERE id = %s", [prop.id])
+        self.Property.init()
+        prop.invalidate_recordset(['date_sold'])
+        self.assertTrue(prop.date_sold)
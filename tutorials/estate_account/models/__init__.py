@@ -1 +1,2 @@
-from . import estate_property
\ No newline at end of file
+from . import estate_property
+from . import account_journal
\ No newline at end of file
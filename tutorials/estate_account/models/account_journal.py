@@ -0,0 +1,56 @@
+from collections import Counter
+from odoo import api, models, tools
+
+# hit/miss counters of the sale journal cache, per database
+_sale_journal_cache_stats = Counter()
+
+# journal fields that can change which journal is the default sale journal
+_SALE_JOURNAL_FIELDS = {"type", "company_id", "active", "sequence", "code"}
+
+class AccountJournal(models.Model):
+    _inherit = "account.journal"
+
+    @api.model
+    def _get_estate_sale_journal(self, company):
+        """Return the default sale journal of the company, served from a
+        registry-level cache, or else a sale journal of the user's companies.
+        """
+        dbname = self.env.cr.dbname
+        _sale_journal_cache_stats[dbname, "calls"] += 1
+        journal = self.browse(self._get_estate_sale_journal_id(company.id))
+        if not journal:
+            # not cached: the result depends on the companies of the user
+            journal = self.search([("type", "=", "sale"), ("company_id", "in", self.env.companies.ids)], limit=1)
+        return journal
+
+    @api.model
+    @tools.ormcache("company_id")
+    def _get_estate_sale_journal_id(self, company_id):
+        _sale_journal_cache_stats[self.env.cr.dbname, "misses"] += 1
+        # sudo: the cached result is shared by every user
+        return self.sudo().search([("type", "=", "sale"), ("company_id", "=", company_id)], limit=1).id
+
+    @api.model
+    def _get_estate_sale_journal_cache_stats(self):
+        """Hit/miss counters of the sale journal cache for this database."""
+        dbname = self.env.cr.dbname
+        calls = _sale_journal_cache_stats[dbname, "calls"]
+        misses = _sale_journal_cache_stats[dbname, "misses"]
+        return {"hits": calls - misses, "misses": misses}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        journals = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return journals
+
+    def write(self, vals):
+        res = super().write(vals)
+        if _SALE_JOURNAL_FIELDS & vals.keys():
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
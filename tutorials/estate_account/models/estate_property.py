@@ -1,67 +1,78 @@
 import logging
-from odoo import api, models, _
+import time
+from odoo import models, _
 from odoo import Command
 
-_logger = logging.getLogger(__name__)
+_metrics_logger = logging.getLogger(__name__ + ".metrics")
 
 class EstateProperty(models.Model):
     _inherit = "estate.property"
 
     def action_sold(self):
-        self.ensure_one()
-        """Extend sell action: create a customer invoice for the buyer,
-        then continue the normal flow via super().
+        """Extend sell action: create a customer invoice for each buyer,
+        all in one batch, then continue the normal flow via super().
         """
+        journals = {}
+        move_vals_list = []
         for prop in self:
+            start = time.perf_counter()
             # Safety net: ensure a buyer is set
             buyer = getattr(prop, "buyer_id", False)
             if not buyer:
                 # For stricter behavior, raise an error instead of skipping
                 continue
 
-            # Retrieve a sales journal (same company as the property when possible)
+            # Sales journal (same company as the property when possible), resolved once per company
             company = prop.salesperson_id.company_id or self.env.company
-            sale_journal = self.env["account.journal"].search(
-                [("type", "=", "sale"), ("company_id", "=", company.id)],
-                limit=1,
-            )
-            if not sale_journal:
-                # As a fallback: use any 'sale' journal
-                sale_journal = self.env["account.journal"].search(
-                    [("type", "=", "sale")], limit=1
-                )
+            if company not in journals:
+                journals[company] = self.env["account.journal"]._get_estate_sale_journal(company)
 
-            # Amounts
-            selling_price = prop.selling_price or 0.0
-            commission = (selling_price * 0.06) if selling_price else 0.0
-            admin_fee = 100.0
-
-            _logger.error(
-                "estate_account: Selling price: %s, Commission: %s, Admin fee: %s",
-                selling_price, commission, admin_fee
+            move_vals_list.append(prop._prepare_invoice_vals(journals[company]))
+            _metrics_logger.debug(
+                "estate_account: property %s invoice prepared in %.3f ms",
+                prop.id, (time.perf_counter() - start) * 1000,
             )
 
-            # Create invoice (account.move)
-            move_vals = {
-                "partner_id": buyer.id,              # The customer (buyer)
-                "move_type": "out_invoice",          # Customer invoice
-                "journal_id": sale_journal.id if sale_journal else False,
-                "invoice_line_ids": [
-                    # 6% commission
-                    Command.create({
-                        "name": ("Commission 6% of selling price"),
-                        "quantity": 1.0,
-                        "price_unit": commission,
-                    }),
-                    # Administrative fee 100.00
-                    Command.create({
-                        "name": _("Administrative fee"),
-                        "quantity": 1.0,
-                        "price_unit": admin_fee,
-                    }),
-                ],
-            }
-            self.env["account.move"].create(move_vals)
+        if move_vals_list:
+            start = time.perf_counter()
+            self.env["account.move"].create(move_vals_list)
+            _metrics_logger.debug(
+                "estate_account: %s invoices created in %.3f ms",
+                len(move_vals_list), (time.perf_counter() - start) * 1000,
+            )
 
         # Continue normal "Sold" flow
         return super().action_sold()
+
+    def _prepare_invoice_vals(self, sale_journal):
+        """Values of the customer invoice for the sale of this property."""
+        self.ensure_one()
+        # Amounts
+        selling_price = self.selling_price or 0.0
+        commission = (selling_price * 0.06) if selling_price else 0.0
+        admin_fee = 100.0
+
+        _metrics_logger.debug(
+            "estate_account: Selling price: %s, Commission: %s, Admin fee: %s",
+            selling_price, commission, admin_fee
+        )
+
+        return {
+            "partner_id": self.buyer_id.id,      # The customer (buyer)
+            "move_type": "out_invoice",          # Customer invoice
+            "journal_id": sale_journal.id if sale_journal else False,
+            "invoice_line_ids": [
+                # 6% commission
+                Command.create({
+                    "name": ("Commission 6% of selling price"),
+                    "quantity": 1.0,
+                    "price_unit": commission,
+                }),
+                # Administrative fee 100.00
+                Command.create({
+                    "name": _("Administrative fee"),
+                    "quantity": 1.0,
+                    "price_unit": admin_fee,
+                }),
+            ],
+        }
@@ -1,2 +1,3 @@
 from . import portal_estate
-from . import website_estate
\ No newline at end of file
+from . import website_estate
+from . import estate_export
\ No newline at end of file
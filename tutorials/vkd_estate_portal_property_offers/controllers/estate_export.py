@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import json
+
+from odoo import api, fields, http
+from odoo.http import request
+
+from ..models.estate_counters import OPEN_PROPERTIES_DOMAIN
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FIELDS = [
+    'name', 'description', 'postcode', 'date_availability', 'expected_price',
+    'bedrooms', 'living_area', 'garden', 'garden_area', 'total_area', 'state',
+    'active', 'best_price', 'property_type_id', 'tag_ids', 'write_date',
+]
+
+
+class EstateExport(http.Controller):
+
+    # EXPORT: /estate/export.ndjson[?since=<write_date>]
+    @http.route(['/estate/export.ndjson'], type='http', auth='user', methods=['GET'])
+    def estate_export(self, since=None, **kw):
+        """Stream the open properties, or every property changed since ``since``.
+
+        A delta export also lists the properties that left the open ones
+        (sold, cancelled, archived): the consumer tells them apart by their
+        ``state`` and ``active`` keys.
+        """
+        context = dict(request.env.context)
+        if since:
+            try:
+                domain = [('write_date', '>', fields.Datetime.to_datetime(since))]
+            except ValueError:
+                return request.make_response("Invalid 'since' date.", status=400)
+            context['active_test'] = False
+        else:
+            domain = list(OPEN_PROPERTIES_DOMAIN)
+
+        # the request cursor is closed once the handler returns: stream on a cursor of our own
+        registry = request.env.registry
+        uid = request.env.uid
+
+        def generate():
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                for line in self._export_lines(env, domain):
+                    yield line
+
+        return request.make_response(generate(), headers=[
+            ('Content-Type', 'application/x-ndjson; charset=utf-8'),
+            ('Cache-Control', 'no-store'),
+        ])
+
+    def _export_lines(self, env, domain):
+        """Yield one JSON line per property, reading the table in id-ordered chunks."""
+        Property = env['estate.property']
+        last_id = 0
+        while True:
+            props = Property.search(domain + [('id', '>', last_id)], order='id', limit=EXPORT_CHUNK_SIZE)
+            if not props:
+                break
+            tag_names = dict(props.tag_ids.mapped(lambda t: (t.id, t.name)))
+            for row in props.read(EXPORT_FIELDS):
+                ptype = row.pop('property_type_id')
+                row.update({
+                    'property_type': ptype and ptype[1],
+                    'tags': [tag_names[tag_id] for tag_id in row.pop('tag_ids') if tag_id in tag_names],
+                    'date_availability': fields.Date.to_string(row['date_availability']),
+                    'write_date': fields.Datetime.to_string(row['write_date']),
+                })
+                yield json.dumps(row) + '\n'
+            last_id = props[-1].id
+            # keep memory flat whatever the table size
+            env.invalidate_all()
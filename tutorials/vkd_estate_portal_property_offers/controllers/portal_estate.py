@@ -1,21 +1,45 @@
 # -*- coding: utf-8 -*-
+import base64
+import binascii
+import math
 from re import S
 from werkzeug.exceptions import NotFound
-from odoo.exceptions import ValidationError
-from odoo import http
+from odoo.exceptions import UserError
+from odoo import _, fields, http
 from odoo.http import request
 
+from ..models.estate_counters import counters
+
+
+def _encode_offer_cursor(offer):
+    """Opaque URL cursor pointing after the given offer."""
+    return base64.urlsafe_b64encode(str(offer.id).encode()).decode().rstrip('=')
+
+
+def _decode_offer_cursor(cursor):
+    """Return the offer id from a cursor, or None for the first page."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        return int(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+def _parse_amount(raw):
+    """Parse a posted amount ('1234.5' or '1234,5'); None when invalid."""
+    try:
+        amount = float(str(raw).strip().replace(',', '.'))
+    except (TypeError, ValueError):
+        return None
+    return amount if math.isfinite(amount) else None
+
 class EstatePortal(http.Controller):
     #HUB: /my/estate
     @http.route(['/my/estate'], type='http', auth='user', website=True)
     def my_estate(self, **kwargs):
-        partner = request.env.user.partner_id
-        Property = request.env['estate.property']
-        Offer = request.env['estate.property.offer']
-
-        prop_domain = [('active', '=', True), ('state', 'not in', ['sold', 'cancelled'])]
-        props_count = Property.search_count(prop_domain)
-        my_offers_count = Offer.search_count([('partner_id', '=', partner.id)])
+        props_count = counters.open_properties(request.env)
+        my_offers_count = counters.my_offers(request.env, request.session)
 
         return request.render(
             'vkd_estate_portal_property_offers.portal_estate_hub',
@@ -81,33 +105,18 @@ class EstatePortal(http.Controller):
     # PLACE BID (POST): /my/estate/properties/<id>/bid
     @http.route(['/my/estate/properties/<int:property_id>/bid'], type='http', auth='user', website=True, methods=['POST'])
     def my_estate_property_bid(self, property_id, **post):
-        Property = request.env['estate.property']
-        Offer = request.env['estate.property.offer']
-        estate = Property.search([('id', '=', property_id), ('active', '=', True)], limit=1)
-        if not estate:
-            raise NotFound()
+        estate = self._get_biddable_property(property_id)
 
         # Parse + validate amount
-        raw = (post or {}).get('amount', '').strip()
-        try:
-            amount = float(raw.replace(',', '.'))
-        except Exception:
+        amount = _parse_amount((post or {}).get('amount'))
+        if amount is None:
             return request.redirect(f'/my/estate/properties/{property_id}?error=invalid_amount')
-
-        offer_amount = Offer.price
-        if amount <= 0 or amount <= offer_amount:
+        if amount <= 0:
             return request.redirect(f'/my/estate/properties/{property_id}?error=non_positive')
 
-        partner = request.env.user.partner_id
-
         try:
-            Offer.create({
-            'price': amount,
-            'partner_id': partner.id,
-            'property_id': estate.id,
-            # 'status': 'draft', 
-        })
-        except ValidationError as e:
+            estate._place_bid(request.env.user.partner_id, amount)
+        except UserError as e:
             msg = e.args[0] if e.args else str(e)
             request.session['estate_bid_error'] = msg
             return request.redirect(f'/my/estate/properties/{property_id}')
@@ -116,12 +125,55 @@ class EstatePortal(http.Controller):
         request.session['estate_bid_ok'] = True
         return request.redirect(f'/my/estate/my-offers')
 
+    # PLACE BID (AJAX): /my/estate/properties/<id>/bid/json
+    @http.route(['/my/estate/properties/<int:property_id>/bid/json'], type='json', auth='user', website=True)
+    def my_estate_property_bid_json(self, property_id, amount=None, **kwargs):
+        estate = self._get_biddable_property(property_id)
+
+        amount = _parse_amount(amount)
+        if amount is None or amount <= 0:
+            return {'success': False, 'error': _("Amount must be greater than zero."), 'best_price': estate.best_price}
+
+        try:
+            offer = estate._place_bid(request.env.user.partner_id, amount)
+        except UserError as e:
+            return {
+                'success': False,
+                'error': e.args[0] if e.args else str(e),
+                'best_price': estate.best_price,
+            }
+        return {'success': True, 'offer_id': offer.id, 'best_price': estate.best_price}
+
+    def _get_biddable_property(self, property_id):
+        estate = request.env['estate.property'].search([('id', '=', property_id), ('active', '=', True)], limit=1)
+        if not estate:
+            raise NotFound()
+        return estate
+
     # MY OFFERS: /my/estate/my-offers 
     @http.route(['/my/estate/my-offers'], type='http', auth='user', website=True)
-    def my_estate_my_offers(self, **kwargs):
+    def my_estate_my_offers(self, cursor=None, **kwargs):
         partner = request.env.user.partner_id
         Offer = request.env['estate.property.offer']
-        offers = Offer.search([('partner_id', '=', partner.id)], order='create_date desc')
+        domain = [('partner_id', '=', partner.id)]
+        limit = 20
+
+        # keyset pagination on id desc: ids follow the creation order, while
+        # create_date (the transaction start, read truncated to the second)
+        # cannot give a stable, gapless key
+        after = _decode_offer_cursor(cursor)
+        page_domain = domain + [('id', '<', after)] if after else domain
+        offers = Offer.search(page_domain, order='id desc', limit=limit + 1)
+        has_next = len(offers) > limit
+        offers = offers[:limit]
+
+        # one batched read per model for what the page displays
+        offers.fetch(['property_id', 'price', 'status', 'create_date'])
+        offers.property_id.fetch(['name', 'property_type_id', 'tag_ids'])
+        offers.property_id.property_type_id.fetch(['name'])
+        offers.property_id.tag_ids.fetch(['name', 'color'])
+
+        status_counts = dict(Offer._read_group(domain, ['status'], ['__count']))
 
         just_submitted = request.session.pop('estate_bid_ok', False)
         return request.render(
@@ -129,6 +181,11 @@ class EstatePortal(http.Controller):
             {
                 'just_submitted': just_submitted,
                 'offers': offers,
+                'status_counts': status_counts,
+                'status_labels': dict(Offer._fields['status']._description_selection(request.env)),
+                'has_prev': bool(after),
+                'has_next': has_next,
+                'next_cursor': _encode_offer_cursor(offers[-1]) if has_next else None,
                 'page_name': 'estate_my_offers',
                 'title': 'My Offers',
                 'breadcrumbs': [
@@ -137,4 +194,4 @@ class EstatePortal(http.Controller):
                                 ('My Offers', False),
                             ],
             }
-        )
\ No newline at end of file
+        )
@@ -1,7 +1,38 @@
 # -*- coding: utf-8 -*-
+import base64
+import binascii
+from datetime import datetime, timezone
+
 from odoo import http
 from odoo.http import request
 
+from ..models.estate_counters import OPEN_PROPERTIES_DOMAIN, counters
+from ..models.estate_page_cache import LIST_VERSION, TAGS_VERSION, get_versions, page_cache, property_version
+
+PAGE_CACHE_TTL_PARAM = 'vkd_estate_portal_property_offers.page_cache_ttl'
+
+# stands for the visitor's CSRF token in the cached pages
+CSRF_PLACEHOLDER = '__estate_page_cache_csrf_token__'
+
+
+def _encode_cursor(direction, record_id):
+    """Opaque URL cursor for keyset pagination."""
+    raw = f"{direction[0]}{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _decode_cursor(cursor):
+    """Return (direction, id) from a cursor; (None, None) for the first page."""
+    if not cursor:
+        return None, None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        direction = {'a': 'after', 'b': 'before'}[raw[0]]
+        return direction, int(raw[1:])
+    except (binascii.Error, UnicodeDecodeError, KeyError, IndexError, ValueError):
+        return None, None
+
+
 class WebsiteEstate(http.Controller):
 
     # Redirect - '/' -> '/estate'
@@ -12,47 +43,118 @@ class WebsiteEstate(http.Controller):
 
     # PUBLIC LIST: /estate (website)
     @http.route(['/estate'], type='http', auth='public', website=True)
-    def estate_public_list(self, page=1, **kw):
+    def estate_public_list(self, cursor=None, with_count=False, **kw):
+        direction, pivot = _decode_cursor(cursor)
+        with_count = str(with_count).lower() in ('1', 'true')
+        return self._render_cached(
+            ('list', direction, pivot, with_count),
+            'vkd_estate_portal_property_offers.website_estate_list',
+            lambda: self._prepare_list_values(direction, pivot, with_count),
+            lambda values: [LIST_VERSION] + [property_version(p.id) for p in values['properties']],
+        )
+
+    def _prepare_list_values(self, direction, pivot, with_count):
         Property = request.env['estate.property'].sudo()
         # Public visibility Rules
-        domain = [('active', '=', True), ('state', 'not in', ['sold', 'cancelled'])]
+        domain = list(OPEN_PROPERTIES_DOMAIN)
         limit = 20
-        page = max(int(page or 1), 1)
-        offset = (page - 1) * limit
 
-        props = Property.search(domain, order='id desc', limit=limit, offset=offset)
-        total = Property.search_count(domain)
-        has_next = (offset + len(props)) < total
-        has_prev = page > 1
+        # keyset pagination on id desc: page after / before a known id
+        if direction == 'before':
+            props = Property.search(domain + [('id', '>', pivot)], order='id asc', limit=limit + 1)
+            has_prev = len(props) > limit
+            props = props[:limit].sorted('id', reverse=True)
+            has_next = True
+        else:
+            if direction == 'after':
+                domain = domain + [('id', '<', pivot)]
+            props = Property.search(domain, order='id desc', limit=limit + 1)
+            has_next = len(props) > limit
+            props = props[:limit]
+            has_prev = direction == 'after'
 
-        return request.render(
-            'vkd_estate_portal_property_offers.website_estate_list',
-            {
-                'properties': props,
-                'page': page,
-                'has_next': has_next,
-                'has_prev': has_prev,
-                'next_page': page + 1,
-                'prev_page': page - 1,
-                'title': 'Estate',
-            }
-        )
+        total = counters.open_properties(request.env) if with_count else None
+
+        return {
+            'properties': props,
+            'total': total,
+            'has_next': has_next and bool(props),
+            'has_prev': has_prev and bool(props),
+            'next_cursor': _encode_cursor('after', props[-1].id) if props else None,
+            'prev_cursor': _encode_cursor('before', props[0].id) if props else None,
+            'title': 'Estate',
+        }
 
     # PUBLIC DETAIL: /estate/<id> (website)
     @http.route(['/estate/<int:property_id>'], type='http', auth='public', website=True)
     def estate_public_detail(self, property_id, **kw):
+        return self._render_cached(
+            ('detail', property_id),
+            'vkd_estate_portal_property_offers.website_estate_detail',
+            lambda: self._prepare_detail_values(property_id),
+            lambda values: [TAGS_VERSION, property_version(property_id)],
+        )
+
+    def _prepare_detail_values(self, property_id):
         Property = request.env['estate.property'].sudo()
         estate = Property.search(
             [('id', '=', property_id), ('active', '=', True), ('state', 'not in', ['sold', 'cancelled'])],
             limit=1
         )
         if not estate:
-            return request.not_found()
+            return None
 
-        return request.render(
-            'vkd_estate_portal_property_offers.website_estate_detail',
-            {
-                'estate': estate,
-                'title': estate.display_name,
-            }
-        )
+        return {
+            'estate': estate,
+            'title': estate.display_name,
+        }
+
+    def _render_cached(self, key, template, prepare_values, version_keys):
+        """Render the template, through the page cache for anonymous visitors.
+
+        The cache is opt-in: it stays off until the page_cache_ttl system
+        parameter is set to a number of seconds. ``prepare_values`` returns
+        the qcontext, or None for a 404; ``version_keys`` returns, from the
+        qcontext, the version keys the page depends on.
+        """
+        ttl = int(request.env['ir.config_parameter'].sudo().get_param(PAGE_CACHE_TTL_PARAM, 0) or 0)
+        if not ttl or not request.env.user._is_public():
+            values = prepare_values()
+            if values is None:
+                return request.not_found()
+            return request.render(template, values)
+
+        key = (request.env.cr.dbname, request.website.id, request.lang.code) + key
+        entry = page_cache.get(key)
+        if entry is not None and get_versions(request.env.cr, entry.version_keys) != entry.versions:
+            page_cache.discard(key, entry)
+            entry = None
+        if entry is None:
+            values = prepare_values()
+            if values is None:
+                return request.not_found()
+            keys = version_keys(values)
+            versions = get_versions(request.env.cr, keys)
+            entry = page_cache.set(key, self._render_shared(template, values), ttl, keys, versions)
+
+        # the session-bound parts (t-nocache) are filled in per visitor
+        body = entry.body.replace(CSRF_PLACEHOLDER.encode(), request.csrf_token(None).encode())
+        response = request.make_response(body, headers=[
+            ('Content-Type', 'text/html; charset=utf-8'),
+            ('Cache-Control', 'private, no-cache'),
+        ])
+        response.set_etag(entry.etag, weak=True)
+        response.last_modified = datetime.fromtimestamp(int(entry.last_modified), timezone.utc)
+        return response.make_conditional(request.httprequest)
+
+    def _render_shared(self, template, values):
+        """Render a page that any anonymous visitor may be served.
+
+        The CSRF token is bound to the session that renders the page: it is
+        rendered as a placeholder, replaced with the token of each visitor.
+        """
+        request.csrf_token = lambda *args, **kwargs: CSRF_PLACEHOLDER
+        try:
+            return request.render(template, values, lazy=False)
+        finally:
+            del request.csrf_token
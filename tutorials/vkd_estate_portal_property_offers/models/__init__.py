@@ -0,0 +1,3 @@
+from . import estate_counters
+from . import estate_page_cache
+from . import estate_property
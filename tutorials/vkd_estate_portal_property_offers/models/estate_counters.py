@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+OPEN_PROPERTIES_DOMAIN = [('active', '=', True), ('state', 'not in', ['sold', 'cancelled'])]
+
+OPEN_PROPERTIES_TTL = 60  # seconds
+MY_OFFERS_TTL = 300  # seconds
+MY_OFFERS_SESSION_KEY = 'estate_my_offers_count'
+
+
+class EstateCounters:
+    """Cached counters of the portal hub.
+
+    The open properties count is global: it is kept per database in the
+    worker for OPEN_PROPERTIES_TTL seconds, and dropped on property
+    create/unlink and state/active writes. The offers count of the partner
+    is kept in the session and dropped when that session places an offer.
+    """
+
+    def __init__(self):
+        self._open_properties = {}
+        self._lock = threading.Lock()
+
+    def open_properties(self, env):
+        dbname = env.cr.dbname
+        expires, count = self._open_properties.get(dbname, (0, 0))
+        if expires < time.monotonic():
+            count = env['estate.property'].sudo().search_count(OPEN_PROPERTIES_DOMAIN)
+            with self._lock:
+                self._open_properties[dbname] = (time.monotonic() + OPEN_PROPERTIES_TTL, count)
+        return count
+
+    def invalidate_open_properties(self, dbname):
+        with self._lock:
+            self._open_properties.pop(dbname, None)
+
+    def my_offers(self, env, session):
+        partner = env.user.partner_id
+        cached = session.get(MY_OFFERS_SESSION_KEY)
+        if cached and cached['partner_id'] == partner.id and cached['expires'] > time.time():
+            return cached['count']
+        count = env['estate.property.offer'].search_count([('partner_id', '=', partner.id)])
+        session[MY_OFFERS_SESSION_KEY] = {
+            'partner_id': partner.id,
+            'count': count,
+            'expires': time.time() + MY_OFFERS_TTL,
+        }
+        return count
+
+    def invalidate_my_offers(self, session):
+        session.pop(MY_OFFERS_SESSION_KEY, None)
+
+
+counters = EstateCounters()
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from psycopg2.errors import SerializationFailure
+
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+PAGE_CACHE_SIZE = 512  # max entries kept per worker
+
+# versions of the cached pages, shared by all the workers: one row per key
+VERSION_TABLE = 'estate_page_cache_versions'
+VERSION_SEQUENCE = 'estate_page_cache_version'
+
+# which properties the list shows (creation, archiving, sale...)
+LIST_VERSION = 'list'
+# the tags, shown on every detail page
+TAGS_VERSION = 'tags'
+
+CachedPage = namedtuple('CachedPage', ['body', 'etag', 'last_modified', 'expires', 'version_keys', 'versions'])
+
+
+def property_version(property_id):
+    """Version key of what a page shows of one property."""
+    return f'property/{property_id}'
+
+
+def create_version_table(cr):
+    cr.execute(SQL(
+        """
+        CREATE SEQUENCE IF NOT EXISTS %(sequence)s;
+        CREATE TABLE IF NOT EXISTS %(table)s (key varchar PRIMARY KEY, version bigint NOT NULL)
+        """,
+        sequence=SQL.identifier(VERSION_SEQUENCE),
+        table=SQL.identifier(VERSION_TABLE),
+    ))
+
+
+def get_versions(cr, keys):
+    """Current versions of ``keys``, as a tuple in the same order (0 for unknown keys).
+
+    Read in the transaction of the request, so they match the data the page
+    is rendered from.
+    """
+    cr.execute(SQL(
+        "SELECT key, version FROM %s WHERE key = ANY(%s)",
+        SQL.identifier(VERSION_TABLE), list(keys),
+    ))
+    versions = dict(cr.fetchall())
+    return tuple(versions.get(key, 0) for key in keys)
+
+
+def bump_versions(env, keys):
+    """Outdate the cached pages depending on ``keys``, once the transaction commits.
+
+    The bump runs after the commit, in a transaction of its own: a request
+    that reads the new version also sees the change, and concurrent writes
+    on the same listings do not contend on the version rows.
+    """
+    data = env.cr.postcommit.data
+    pending = data.get(VERSION_TABLE)
+    if pending is not None:
+        pending.update(keys)
+        return
+    pending = data[VERSION_TABLE] = set(keys)
+    registry = env.registry
+
+    def bump():
+        for _attempt in range(5):
+            try:
+                with registry.cursor() as cr:
+                    cr.execute(SQL(
+                        """
+                        INSERT INTO %(table)s (key, version)
+                        SELECT key, nextval(%(sequence)s) FROM unnest(%(keys)s::varchar[]) AS key
+                        ON CONFLICT (key) DO UPDATE SET version = EXCLUDED.version
+                        """,
+                        table=SQL.identifier(VERSION_TABLE),
+                        sequence=VERSION_SEQUENCE,
+                        keys=sorted(pending),
+                    ))
+                return
+            except SerializationFailure:
+                continue
+        _logger.warning("estate: page cache versions %s not bumped, the pages expire with their TTL", sorted(pending))
+
+    env.cr.postcommit.add(bump)
+
+
+class PageCache:
+    """Worker-local LRU of rendered pages, with a TTL per entry.
+
+    Each entry records the version keys it depends on (see bump_versions)
+    and their versions at render time: a detail page depends on its
+    property and the tags, a list page on the list and the properties it
+    shows. The caller compares them to the current versions, so a change
+    outdates only the pages showing it, in every worker.
+    """
+
+    def __init__(self, size=PAGE_CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, body, ttl, version_keys=(), versions=()):
+        data = body.encode() if isinstance(body, str) else body
+        entry = CachedPage(
+            body=data,
+            etag=hashlib.sha1(data).hexdigest(),
+            last_modified=time.time(),
+            expires=time.monotonic() + ttl,
+            version_keys=tuple(version_keys),
+            versions=tuple(versions),
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def discard(self, key, entry):
+        """Drop ``entry`` unless it was replaced meanwhile."""
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+
+
+page_cache = PageCache()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from odoo import api, models
+from odoo.http import request
+
+from .estate_counters import counters
+from .estate_page_cache import LIST_VERSION, TAGS_VERSION, bump_versions, create_version_table, property_version
+
+# states of the properties the public list does not show
+CLOSED_STATES = {'sold', 'cancelled'}
+
+
+def invalidate_pages(env, property_ids=(), list_changed=False):
+    """Outdate, in every worker, the cached pages showing the given properties."""
+    keys = {property_version(property_id) for property_id in property_ids}
+    if list_changed:
+        keys.add(LIST_VERSION)
+    if keys:
+        bump_versions(env, keys)
+
+
+class EstateProperty(models.Model):
+    _inherit = 'estate.property'
+
+    def init(self):
+        super().init()
+        create_version_table(self.env.cr)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        invalidate_pages(self.env, list_changed=True)
+        counters.invalidate_open_properties(self.env.cr.dbname)
+        return records
+
+    def write(self, vals):
+        # whether the public list may show other properties afterwards
+        list_changed = 'active' in vals or 'state' in vals and (
+            vals['state'] in CLOSED_STATES or any(p.state in CLOSED_STATES for p in self))
+        res = super().write(vals)
+        invalidate_pages(self.env, self.ids, list_changed=list_changed)
+        if list_changed:
+            counters.invalidate_open_properties(self.env.cr.dbname)
+        return res
+
+    def unlink(self):
+        property_ids = self.ids
+        res = super().unlink()
+        invalidate_pages(self.env, property_ids, list_changed=True)
+        counters.invalidate_open_properties(self.env.cr.dbname)
+        return res
+
+
+class EstatePropertyOffer(models.Model):
+    _inherit = 'estate.property.offer'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        invalidate_pages(self.env, records.property_id.ids)
+        if request:
+            counters.invalidate_my_offers(request.session)
+        return records
+
+    def write(self, vals):
+        property_ids = set(self.property_id.ids)
+        res = super().write(vals)
+        invalidate_pages(self.env, property_ids | set(self.property_id.ids))
+        return res
+
+    def unlink(self):
+        property_ids = self.property_id.ids
+        res = super().unlink()
+        invalidate_pages(self.env, property_ids)
+        return res
+
+
+class EstatePropertyTag(models.Model):
+    _inherit = 'estate.property.tag'
+
+    # tags are shown on every detail page
+
+    def write(self, vals):
+        res = super().write(vals)
+        bump_versions(self.env, {TAGS_VERSION})
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        bump_versions(self.env, {TAGS_VERSION})
+        return res
@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+from . import test_portal_my_offers
+from . import test_portal_bid
+from . import test_website_estate
+from . import test_estate_export
+from . import test_estate_export_benchmark
\ No newline at end of file
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import json
+
+from odoo.tests import HttpCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestEstateExport(HttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        property_type = cls.env['estate.property.type'].create({'name': 'House'})
+        tag = cls.env['estate.property.tag'].create({'name': 'Export tag'})
+        cls.open_property, cls.cancelled, cls.archived = cls.env['estate.property'].create([
+            {
+                'name': f'Export {name}',
+                'property_type_id': property_type.id,
+                'expected_price': 100000.0,
+                'tag_ids': [(6, 0, tag.ids)],
+            }
+            for name in ('open', 'cancelled', 'archived')
+        ])
+        cls.cancelled.state = 'cancelled'
+        cls.archived.active = False
+
+    def _export(self, query=''):
+        """Exported lines of the properties of this test, by name."""
+        self.authenticate('admin', 'admin')
+        response = self.url_open('/estate/export.ndjson' + query)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        return {row['name']: row for row in rows if row['name'].startswith('Export ')}
+
+    def test_export_open_properties(self):
+        rows = self._export()
+        self.assertEqual(list(rows), ['Export open'])
+        row = rows['Export open']
+        self.assertEqual(row['id'], self.open_property.id)
+        self.assertEqual(row['property_type'], 'House')
+        self.assertEqual(row['tags'], ['Export tag'])
+        self.assertTrue(row['active'])
+
+    def test_export_since_lists_closed_properties(self):
+        rows = self._export('?since=2000-01-01 00:00:00')
+        self.assertEqual(set(rows), {'Export open', 'Export cancelled', 'Export archived'})
+        self.assertEqual(rows['Export cancelled']['state'], 'cancelled')
+        self.assertFalse(rows['Export archived']['active'])
+
+        self.assertFalse(self._export('?since=2999-01-01 00:00:00'))
+
+    def test_export_invalid_since(self):
+        self.authenticate('admin', 'admin')
+        response = self.url_open('/estate/export.ndjson?since=yesterday')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+
+from odoo.tests import HttpCase, tagged
+
+_logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+def _rss():
+    """Resident set size of this process, in bytes."""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+@tagged('-standard', 'estate_benchmark')
+class TestEstateExportBenchmark(HttpCase):
+    """Benchmarks, run on demand with ``--test-tags estate_benchmark``."""
+
+    PROPERTIES = 1_000_000
+    MAX_RSS_GROWTH = 200 * MB  # the export itself weighs several hundred MB
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        property_type = cls.env['estate.property.type'].create({'name': 'House'})
+        tag = cls.env['estate.property.tag'].create({'name': 'Benchmark'})
+        cls.env.flush_all()
+        cr = cls.env.cr
+        # plain SQL, the ORM would spend minutes on a million properties
+        cr.execute("""
+            INSERT INTO estate_property (name, description, postcode, property_type_id, expected_price,
+                                         bedrooms, facades, living_area, total_area, active, state,
+                                         date_availability, create_date, write_date)
+            SELECT 'Property ' || i, 'A property to export', '1000', %(type)s, 100000, 2, 1, 80, 80,
+                   TRUE, 'new', current_date, now() AT TIME ZONE 'UTC', now() AT TIME ZONE 'UTC'
+              FROM generate_series(1, %(properties)s) i
+        """, {'type': property_type.id, 'properties': cls.PROPERTIES})
+        cr.execute("""
+            INSERT INTO estate_property_estate_property_tag_rel (estate_property_id, estate_property_tag_id)
+            SELECT id, %s FROM estate_property WHERE id %% 10 = 0
+        """, [tag.id])
+        cr.execute("ANALYZE estate_property")
+        cls.env.invalidate_all()
+
+    def test_export_1m_properties(self):
+        self.authenticate('admin', 'admin')
+        baseline = peak = _rss()
+        streaming = threading.Event()
+
+        def sample():
+            nonlocal peak
+            while not streaming.wait(0.05):
+                peak = max(peak, _rss())
+
+        sampler = threading.Thread(target=sample)
+        sampler.start()
+        lines = size = 0
+        start = time.time()
+        try:
+            # streamed on the client side as well, the lines are only counted
+            response = self.opener.get(self.base_url() + '/estate/export.ndjson', stream=True, timeout=600)
+            self.assertEqual(response.status_code, 200)
+            for line in response.iter_lines():
+                lines += 1
+                size += len(line)
+        finally:
+            streaming.set()
+            sampler.join()
+        duration = time.time() - start
+
+        _logger.info(
+            "estate benchmark export: %s lines (%.0f MB) in %.2fs, peak RSS growth %.0f MB",
+            lines, size / MB, duration, (peak - baseline) / MB,
+        )
+        self.assertGreaterEqual(lines, self.PROPERTIES)
+        self.assertLess(peak - baseline, self.MAX_RSS_GROWTH, "the export must not buffer the table")
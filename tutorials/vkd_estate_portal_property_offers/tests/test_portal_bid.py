@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from odoo.tests import HttpCase, new_test_user, tagged
+
+BIDS = 60
+
+
+@tagged('post_install', '-at_install')
+class TestPortalBidJson(HttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.bidder = new_test_user(cls.env, login='portal_bidder', groups='base.group_portal')
+        cls.estate = cls.env['estate.property'].create({
+            'name': 'Auction',
+            'property_type_id': cls.env['estate.property.type'].create({'name': 'House'}).id,
+            'expected_price': 100000.0,
+        })
+
+    def _bid(self, amount):
+        return self.make_jsonrpc_request(
+            f'/my/estate/properties/{self.estate.id}/bid/json', {'amount': amount})
+
+    def test_bid_json(self):
+        self.authenticate('portal_bidder', 'portal_bidder')
+        result = self._bid('1000')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['best_price'], 1000.0)
+
+        result = self._bid('1000')
+        self.assertFalse(result['success'])
+        self.assertEqual(result['best_price'], 1000.0)
+
+        self.assertFalse(self._bid('abc')['success'])
+
+    def test_concurrent_bids_json(self):
+        """Competing AJAX bids: the accepted ones form a strictly increasing sequence."""
+        self.authenticate('portal_bidder', 'portal_bidder')
+        amounts = list(range(1, BIDS + 1))
+        random.shuffle(amounts)
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(self._bid, amounts))
+
+        accepted = [amount for amount, result in zip(amounts, results) if result['success']]
+        prices = self.estate.offer_ids.sorted('id').mapped('price')
+        self.assertEqual(sorted(prices), sorted(accepted))
+        self.assertEqual(prices, sorted(set(prices)), "offer prices must be strictly increasing")
+        self.assertEqual(self.estate.best_price, float(BIDS))
+        # every refused bid saw a best price at least as high as its amount
+        for amount, result in zip(amounts, results):
+            if not result['success']:
+                self.assertGreaterEqual(result['best_price'], amount)
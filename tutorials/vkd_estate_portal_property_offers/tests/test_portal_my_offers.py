@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import re
+
+from odoo.tests import HttpCase, new_test_user, tagged
+
+CURSOR_RE = re.compile(r'my-offers\?cursor=([\w-]+)')
+OFFER_ROW_RE = re.compile(r'data-offer-id="(\d+)"')
+
+
+@tagged('post_install', '-at_install')
+class TestPortalMyOffers(HttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.property_type = cls.env['estate.property.type'].create({'name': 'House'})
+        cls.tag = cls.env['estate.property.tag'].create({'name': 'Garden'})
+        cls.few = new_test_user(cls.env, login='portal_few', groups='base.group_portal')
+        cls.many = new_test_user(cls.env, login='portal_many', groups='base.group_portal')
+        cls.offers_few = cls._create_offers(cls.few, 3)
+        cls.offers_many = cls._create_offers(cls.many, 45)
+
+    @classmethod
+    def _create_offers(cls, user, count):
+        props = cls.env['estate.property'].create([
+            {
+                'name': f'{user.login} {i}',
+                'property_type_id': cls.property_type.id,
+                'expected_price': 100000.0,
+                'tag_ids': [(6, 0, cls.tag.ids)],
+            }
+            for i in range(count)
+        ])
+        return cls.env['estate.property.offer'].create([
+            {'property_id': prop.id, 'partner_id': user.partner_id.id, 'price': 1000.0}
+            for prop in props
+        ])
+
+    def _open_my_offers(self, cursor=None):
+        url = '/my/estate/my-offers' + (f'?cursor={cursor}' if cursor else '')
+        response = self.url_open(url)
+        self.assertEqual(response.status_code, 200)
+        return response.text
+
+    def _count_page_queries(self, login):
+        self.authenticate(login, login)
+        self._open_my_offers()  # warm up the caches
+        start = self.cr.sql_log_count
+        self._open_my_offers()
+        return self.cr.sql_log_count - start
+
+    def test_query_count_does_not_depend_on_offers(self):
+        """A full page of offers costs the same queries as a page of three."""
+        queries = self._count_page_queries('portal_few')
+        self.authenticate('portal_many', 'portal_many')
+        self._open_my_offers()
+        with self.assertQueryCount(queries):
+            self._open_my_offers()
+
+    def test_pages_list_every_offer_once(self):
+        self.authenticate('portal_many', 'portal_many')
+        seen = []
+        cursor = None
+        for _page in range(5):
+            html = self._open_my_offers(cursor)
+            seen += [int(offer_id) for offer_id in OFFER_ROW_RE.findall(html)]
+            match = CURSOR_RE.search(html)
+            if not match:
+                break
+            cursor = match.group(1)
+        self.assertEqual(seen, sorted(self.offers_many.ids, reverse=True))
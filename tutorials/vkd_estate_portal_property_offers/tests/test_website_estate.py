@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from odoo.tests import HttpCase, tagged
+
+from ..controllers import website_estate
+from ..controllers.website_estate import PAGE_CACHE_TTL_PARAM, WebsiteEstate
+from ..models.estate_page_cache import PageCache
+
+
+@tagged('post_install', '-at_install')
+class TestWebsiteEstate(HttpCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.property_type = cls.env['estate.property.type'].create({'name': 'House'})
+        cls.props = cls.env['estate.property'].create([
+            {'name': f'Listing {i}', 'property_type_id': cls.property_type.id, 'expected_price': 100000.0}
+            for i in range(3)
+        ])
+
+    def _list(self, query=''):
+        response = self.url_open('/estate' + query)
+        self.assertEqual(response.status_code, 200)
+        return response.text
+
+    def test_list_with_count(self):
+        for query in ('?with_count=1', '?with_count=true', '?with_count=True'):
+            self.assertIn('class="text-muted">(', self._list(query), query)
+        for query in ('', '?with_count=0', '?with_count=false', '?with_count='):
+            self.assertNotIn('class="text-muted">(', self._list(query), query)
+
+    def _count_renders(self):
+        """Enable the page cache; return the number of list and detail renders so far."""
+        self.env['ir.config_parameter'].sudo().set_param(PAGE_CACHE_TTL_PARAM, 3600)
+        self.patch(website_estate, 'page_cache', PageCache())
+        renders = {'list': 0, 'detail': 0}
+        prepare_list = WebsiteEstate._prepare_list_values
+        prepare_detail = WebsiteEstate._prepare_detail_values
+
+        def count_list(controller, *args):
+            renders['list'] += 1
+            return prepare_list(controller, *args)
+
+        def count_detail(controller, *args):
+            renders['detail'] += 1
+            return prepare_detail(controller, *args)
+
+        self.startPatcher(patch.object(WebsiteEstate, '_prepare_list_values', count_list))
+        self.startPatcher(patch.object(WebsiteEstate, '_prepare_detail_values', count_detail))
+        return renders
+
+    def _detail(self, estate):
+        response = self.url_open(f'/estate/{estate.id}')
+        self.assertEqual(response.status_code, 200)
+        return response.text
+
+    def test_page_cache_outdates_changed_property_only(self):
+        renders = self._count_renders()
+        first, second = self.props[:2]
+        self._detail(first)
+        self._detail(second)
+        self._list()
+        self.assertEqual(renders, {'list': 1, 'detail': 2})
+
+        self.env['estate.property.offer'].create({
+            'property_id': first.id, 'partner_id': self.env.ref('base.partner_admin').id, 'price': 95000.0,
+        })
+        self.env.cr.postcommit.run()
+        self._detail(first)
+        self._detail(second)
+        self.assertEqual(renders['detail'], 3, "only the page of the property bid on is rendered again")
+        self._list()
+        self.assertEqual(renders['list'], 2, "the list shows the property bid on")
+
+    def test_page_cache_keeps_lists_not_showing_the_property(self):
+        renders = self._count_renders()
+        hidden = self.env['estate.property'].create({
+            'name': 'Listing on another page', 'property_type_id': self.property_type.id, 'expected_price': 100000.0,
+        })
+        self.env.cr.postcommit.run()
+        cursor = website_estate._encode_cursor('after', hidden.id)
+        self._list(f'?cursor={cursor}')
+        self.assertEqual(renders['list'], 1)
+
+        hidden.write({'name': 'Renamed listing'})
+        self.env.cr.postcommit.run()
+        self._list(f'?cursor={cursor}')
+        self.assertEqual(renders['list'], 1, "the page after the property does not show it")
+        self.assertIn('Renamed listing', self._list())
+        self.assertEqual(renders['list'], 2)
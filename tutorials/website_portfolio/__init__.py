@@ -3,4 +3,5 @@
 
 from . import controllers
 from . import models
+from . import tools
 from . import wizard
\ No newline at end of file
@@ -1,7 +1,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 {
     "name": "Website Portfolio",
-    "version": "18.0.1.2",
+    "version": "18.0.1.4",
     "author": "Asbjørn Jacobsen",
     "summary": "Portfolio of code projects (list + detail on website)",
     "category": "Website",
@@ -15,6 +15,9 @@
         "views/website_portfolio_templates_views.xml",
         "views/website_portfolio_views.xml",
         "views/website_portfolio_github_wizard_views.xml",
+        "views/website_portfolio_github_source_views.xml",
+        "views/website_portfolio_import_job_views.xml",
+        "data/ir_cron_data.xml",
     ],
     "assets": {
         "web.assets_backend": [
@@ -2,4 +2,6 @@
 # -*- coding: utf-8 -*-
 
 from . import website_portfolio
+from . import website_portfolio_github_source
+from . import website_portfolio_import_job
 from . import website_portfolio_tag
\ No newline at end of file
@@ -21,6 +21,10 @@ class WebsitePortfolio(models.Model):
     publish_to   = fields.Datetime("Publish To")
 
     github_full_name = fields.Char(index=True, help="GitHub owner/repo, e.g. 'odoo/odoo'")
+    github_pushed_at = fields.Datetime("Last Push", readonly=True, copy=False,
+                                       help="GitHub 'pushed_at' seen at the last import.")
+    github_updated_at = fields.Datetime("Last GitHub Update", readonly=True, copy=False,
+                                        help="GitHub 'updated_at' seen at the last import.")
 
     _sql_constraints = [
         ('uniq_github_full_name', 'unique(github_full_name)', 'This GitHub repository is already imported.')
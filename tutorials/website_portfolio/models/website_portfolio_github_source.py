@@ -0,0 +1,179 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import logging
+import time
+from datetime import datetime
+from odoo import models, fields, api
+
+from ..tools.github_client import GithubRateLimited
+
+_logger = logging.getLogger(__name__)
+
+
+class WebsitePortfolioGithubSource(models.Model):
+    _name = "website.portfolio.github.source"
+    _description = "GitHub Owner Synchronized into the Portfolio"
+    _order = "owner"
+    _rec_name = "owner"
+
+    owner = fields.Char(required=True, help="GitHub user or organization")
+    token = fields.Char(groups="base.group_system", help="Optional personal access token")
+    active = fields.Boolean(default=True)
+
+    include_private = fields.Boolean(string="Include private (requires token)")
+    import_topics = fields.Boolean(string="Create tags from GitHub topics", default=True)
+    import_primary_language = fields.Boolean(string="Tag with primary language", default=True)
+    import_all_languages = fields.Boolean(string="Tag with all languages", default=False)
+    fetch_readme = fields.Boolean(string="Fetch README content", default=True)
+    publish_now = fields.Boolean(string="Publish imported repos", default=True)
+
+    # progress of the current pass, kept across cron runs
+    sync_state = fields.Selection(
+        selection=[
+            ("idle", "Idle"),
+            ("running", "In Progress"),
+            ("done", "Done"),
+            ("error", "Error"),
+        ],
+        string="Sync Status",
+        default="idle",
+        required=True,
+        readonly=True,
+        copy=False,
+    )
+    sync_cursor = fields.Char(
+        readonly=True, copy=False,
+        help="Last repository (full name) processed by the current pass; the next run resumes after it.",
+    )
+    sync_repo_count = fields.Integer(string="Repos Processed", readonly=True, copy=False)
+    sync_created = fields.Integer(string="Created", readonly=True, copy=False)
+    sync_updated = fields.Integer(string="Updated", readonly=True, copy=False)
+    sync_skipped = fields.Integer(string="Unchanged", readonly=True, copy=False)
+    last_sync_start = fields.Datetime(readonly=True, copy=False)
+    last_sync_done = fields.Datetime(string="Last Full Sync", readonly=True, copy=False)
+    last_error = fields.Text(readonly=True, copy=False)
+
+    _sql_constraints = [
+        ('uniq_owner', 'unique(owner)', 'This GitHub owner is already synchronized.')
+    ]
+
+    @api.model
+    def _cron_sync(self, batch_size=50, time_budget=240, auto_commit=True):
+        """Synchronize the active owners in committed batches of repos.
+
+        Stops once ``time_budget`` seconds are spent; an interrupted pass
+        resumes from ``sync_cursor`` on the next run. Owners with a pass in
+        progress come first, then the least recently synchronized ones.
+        """
+        deadline = time.time() + time_budget
+        sources = self.search([]).sorted(
+            lambda s: (s.sync_state not in ("running", "error"), s.last_sync_done or datetime.min)
+        )
+        for source in sources:
+            if time.time() >= deadline:
+                break
+            try:
+                source._sync(batch_size, deadline, auto_commit)
+            except GithubRateLimited as e:
+                if not auto_commit:
+                    raise
+                self.env.cr.rollback()
+                _logger.info("website_portfolio: GitHub sync of %s paused: %s", source.owner, e)
+            except Exception as e:
+                if not auto_commit:
+                    raise
+                self.env.cr.rollback()
+                _logger.exception("website_portfolio: GitHub sync of %s failed", source.owner)
+                source.write({"sync_state": "error", "last_error": str(e)})
+                self.env.cr.commit()
+
+    def action_sync_now(self):
+        for source in self:
+            source._sync(batch_size=50, deadline=time.time() + 240, auto_commit=False)
+
+    def action_restart_sync(self):
+        self.write({"sync_state": "idle", "sync_cursor": False})
+
+    def _sync(self, batch_size, deadline, auto_commit=True):
+        """Run (or resume) a pass over the owner's repos until done or ``deadline``.
+
+        Returns whether the pass completed.
+        """
+        self.ensure_one()
+        if self.sync_state in ("idle", "done"):
+            self.write({
+                "sync_state": "running",
+                "sync_cursor": False,
+                "sync_repo_count": 0,
+                "sync_created": 0,
+                "sync_updated": 0,
+                "sync_skipped": 0,
+                "last_sync_start": fields.Datetime.now(),
+                "last_error": False,
+            })
+
+        wizard = self.env["website.portfolio.github_wizard"].create(self._prepare_wizard_vals())
+        # the listing is sorted by full name, so the cursor is a resume point
+        cursor = (self.sync_cursor or "").lower()
+        with wizard._github_client() as client:
+            client.deadline = deadline
+            batch = []
+            for meta in wizard._iter_owner_repos(self.owner, self.include_private, client=client):
+                if cursor and (meta.get("full_name") or "").lower() <= cursor:
+                    continue
+                batch.append(meta)
+                if len(batch) < batch_size:
+                    continue
+                throttled = self._sync_batch(wizard, client, batch, auto_commit)
+                batch = []
+                if throttled or time.time() >= deadline:
+                    return False
+            if batch and self._sync_batch(wizard, client, batch, auto_commit):
+                return False
+
+        self.write({
+            "sync_state": "done",
+            "sync_cursor": False,
+            "last_sync_done": fields.Datetime.now(),
+            "last_error": False,
+        })
+        if auto_commit:
+            self.env.cr.commit()
+        return True
+
+    def _sync_batch(self, wizard, client, metas, auto_commit):
+        """Import a batch of repos; return whether the rate limit left some pending.
+
+        The cursor stops before the first pending repo, the next run resumes there.
+        """
+        report = {}
+        counts = wizard._import_repos(metas, client, report=report)
+        done = metas
+        for index, meta in enumerate(metas):
+            if report.get(meta.get("full_name"), {}).get("status") == "pending":
+                done = metas[:index]
+                break
+        self.write({
+            "sync_cursor": done[-1].get("full_name") if done else self.sync_cursor,
+            "sync_repo_count": self.sync_repo_count + len(done),
+            "sync_created": self.sync_created + counts["created"],
+            "sync_updated": self.sync_updated + counts["updated"],
+            "sync_skipped": self.sync_skipped + counts["skipped"],
+        })
+        if auto_commit:
+            self.env.cr.commit()
+        return bool(counts["pending"])
+
+    def _prepare_wizard_vals(self):
+        return {
+            "owner": self.owner,
+            "token": self.sudo().token,
+            "include_private": self.include_private,
+            "import_topics": self.import_topics,
+            "import_primary_language": self.import_primary_language,
+            "import_all_languages": self.import_all_languages,
+            "fetch_readme": self.fetch_readme,
+            "publish_now": self.publish_now,
+            "skip_existing": False,
+            "force_update": False,
+        }
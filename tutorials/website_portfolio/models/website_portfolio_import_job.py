@@ -0,0 +1,278 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import logging
+import time
+from datetime import datetime
+from psycopg2.errors import SerializationFailure
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+
+from ..tools.github_client import GithubRateLimited
+
+_logger = logging.getLogger(__name__)
+
+# wizard options copied on the job, see WebsitePortfolioGithubWizard
+IMPORT_OPTIONS = [
+    "owner", "include_private", "publish_now", "publish_from", "publish_to",
+    "import_topics", "import_primary_language", "import_all_languages",
+    "skip_existing", "fetch_readme", "force_update",
+]
+
+# stop a run when fewer API calls than this are left until the rate-limit reset
+RATE_LIMIT_RESERVE = 50
+
+
+class WebsitePortfolioImportJob(models.Model):
+    _name = "website.portfolio.import.job"
+    _description = "GitHub Import Job"
+    _order = "id desc"
+
+    name = fields.Char(required=True)
+    user_id = fields.Many2one("res.users", string="Requested By", default=lambda self: self.env.user)
+    state = fields.Selection(
+        selection=[
+            ("queued", "Queued"),
+            ("listing", "Listing Repos"),
+            ("running", "Importing"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+            ("cancelled", "Cancelled"),
+        ],
+        default="queued",
+        required=True,
+        readonly=True,
+        copy=False,
+    )
+
+    # import options
+    owner = fields.Char(required=True)
+    token = fields.Char(groups="base.group_system")
+    include_private = fields.Boolean()
+    publish_now = fields.Boolean(default=True)
+    publish_from = fields.Datetime()
+    publish_to = fields.Datetime()
+    import_topics = fields.Boolean(default=True)
+    import_primary_language = fields.Boolean(default=True)
+    import_all_languages = fields.Boolean()
+    skip_existing = fields.Boolean(default=True)
+    fetch_readme = fields.Boolean(default=True)
+    force_update = fields.Boolean()
+
+    # progress
+    line_ids = fields.One2many("website.portfolio.import.job.line", "job_id", string="Repositories")
+    repo_total = fields.Integer(string="Repos", readonly=True)
+    repo_done = fields.Integer(string="Processed", readonly=True)
+    progress = fields.Float(compute="_compute_progress")
+    created_count = fields.Integer(string="Created", readonly=True)
+    updated_count = fields.Integer(string="Updated", readonly=True)
+    skipped_count = fields.Integer(string="Skipped", readonly=True)
+    failed_count = fields.Integer(string="Failed", readonly=True)
+    rate_limit_remaining = fields.Integer(string="API Calls Left", readonly=True)
+    rate_limit_reset = fields.Datetime(string="API Limit Reset", readonly=True)
+    api_requests = fields.Integer(string="API Requests", readonly=True)
+    api_not_modified = fields.Integer(string="Not Modified (304)", readonly=True)
+    api_retries = fields.Integer(string="API Retries", readonly=True)
+    api_wait_time = fields.Float(string="Rate-Limit Wait (s)", readonly=True)
+    date_started = fields.Datetime(string="Started", readonly=True)
+    date_finished = fields.Datetime(string="Finished", readonly=True)
+    duration = fields.Float(string="Duration (s)", readonly=True, help="Time spent processing, over all runs.")
+    last_error = fields.Text(readonly=True)
+
+    @api.depends("repo_total", "repo_done")
+    def _compute_progress(self):
+        for job in self:
+            job.progress = 100.0 * job.repo_done / job.repo_total if job.repo_total else 0.0
+
+    @api.model
+    def _enqueue(self, wizard, owner):
+        """Create a job from a GitHub import wizard and wake up the cron.
+
+        ``owner`` is the wizard's owner, normalized by the caller.
+        """
+        vals = {name: wizard[name] for name in IMPORT_OPTIONS}
+        vals.update(owner=owner, name=_("Import of %s", owner), token=wizard.token)
+        job = self.sudo().create(vals)
+        self.env.ref("website_portfolio.ir_cron_website_portfolio_import_job")._trigger()
+        return job
+
+    def action_cancel(self):
+        self.filtered(lambda j: j.state in ("queued", "listing", "running")).write({"state": "cancelled"})
+
+    def action_retry_failed(self):
+        for job in self:
+            failed = job.line_ids.filtered(lambda l: l.status == "failed")
+            if not failed:
+                raise UserError(_("This job has no failed repositories."))
+            failed.write({"status": "pending", "message": False})
+            job.write({
+                "state": "running",
+                "repo_done": job.repo_done - len(failed),
+                "failed_count": job.failed_count - len(failed),
+                "date_finished": False,
+            })
+        self.env.ref("website_portfolio.ir_cron_website_portfolio_import_job")._trigger()
+
+    @api.model
+    def _cron_process(self, chunk_size=25, time_budget=240, auto_commit=True):
+        """Process the pending import jobs in committed chunks of repos.
+
+        Stops once ``time_budget`` seconds are spent or the GitHub rate limit
+        runs low; the jobs resume on the next run. The client never waits for
+        the rate limit past the time budget, the repos it could not fetch stay
+        pending.
+        """
+        deadline = time.time() + time_budget
+        jobs = self.sudo().search([("state", "in", ("queued", "listing", "running"))], order="id")
+        for job in jobs:
+            if time.time() >= deadline:
+                break
+            if job.rate_limit_reset and job.rate_limit_reset > fields.Datetime.now() \
+                    and job.rate_limit_remaining < RATE_LIMIT_RESERVE:
+                continue
+            try:
+                job._process(chunk_size, deadline, auto_commit)
+            except GithubRateLimited as e:
+                if not auto_commit:
+                    raise
+                # e.g. while listing: nothing is lost, the next run starts over
+                self.env.cr.rollback()
+                _logger.info("website_portfolio: import job %s paused: %s", job.id, e)
+            except SerializationFailure:
+                if not auto_commit:
+                    raise
+                # e.g. a tag created by a concurrent import: the chunk is rolled back and retried
+                self.env.cr.rollback()
+                _logger.info("website_portfolio: import job %s hit a concurrent update, resuming later", job.id)
+            except Exception as e:
+                if not auto_commit:
+                    raise
+                self.env.cr.rollback()
+                _logger.exception("website_portfolio: import job %s failed", job.id)
+                job.write({"state": "failed", "last_error": str(e), "date_finished": fields.Datetime.now()})
+                self.env.cr.commit()
+
+    def _process(self, chunk_size, deadline, auto_commit=True):
+        self.ensure_one()
+        wizard = self.env["website.portfolio.github_wizard"].create(self._prepare_wizard_vals())
+        with wizard._github_client() as client:
+            client.deadline = deadline
+            seen = client.metrics
+            if self.state in ("queued", "listing"):
+                self._list_repos(wizard, client)
+                self._write_client_stats(client, seen)
+                self._commit(auto_commit)
+
+            Line = self.env["website.portfolio.import.job.line"]
+            while time.time() < deadline:
+                if self._rate_limited(client):
+                    return
+                lines = Line.search([("job_id", "=", self.id), ("status", "=", "pending")],
+                                    limit=chunk_size, order="sequence, id")
+                if not lines:
+                    break
+                throttled = self._process_chunk(wizard, client, lines)
+                self._write_client_stats(client, seen)
+                self._commit(auto_commit)
+                if throttled:
+                    return
+                # cancelled from the backend meanwhile
+                self.invalidate_recordset(["state"])
+                if self.state == "cancelled":
+                    return
+            else:
+                # out of time, the next run resumes with the pending lines
+                return
+
+        self.write({"state": "done", "date_finished": fields.Datetime.now()})
+        self._commit(auto_commit)
+
+    def _list_repos(self, wizard, client):
+        start = time.time()
+        self.write({"state": "listing", "date_started": self.date_started or fields.Datetime.now()})
+        self.line_ids.unlink()
+        metas = list(wizard._iter_owner_repos(self.owner, self.include_private, client=client))
+        self.env["website.portfolio.import.job.line"].create([
+            {"job_id": self.id, "sequence": seq, "full_name": meta.get("full_name"), "meta": meta}
+            for seq, meta in enumerate(metas)
+        ])
+        self.write({
+            "state": "running",
+            "repo_total": len(metas),
+            "duration": self.duration + time.time() - start,
+        })
+
+    def _process_chunk(self, wizard, client, lines):
+        """Import the repos of ``lines``; return whether the rate limit left some pending."""
+        start = time.time()
+        report = {}
+        counts = wizard._import_repos([line.meta for line in lines], client, report=report)
+        for line in lines:
+            result = report.get(line.full_name) or {"status": "failed", "message": _("Not processed."), "duration": 0.0}
+            line.write(result)
+        self.write({
+            "repo_done": self.repo_done + len(lines) - counts["pending"],
+            "created_count": self.created_count + counts["created"],
+            "updated_count": self.updated_count + counts["updated"],
+            "skipped_count": self.skipped_count + counts["skipped"],
+            "failed_count": self.failed_count + counts["failed"],
+            "duration": self.duration + time.time() - start,
+        })
+        return bool(counts["pending"])
+
+    def _write_client_stats(self, client, seen):
+        """Store the rate-limit state and add the client metrics gathered since ``seen``.
+
+        ``seen`` is updated to the current metrics.
+        """
+        metrics = client.metrics
+        vals = {
+            "api_requests": self.api_requests + metrics["requests"] - seen["requests"],
+            "api_not_modified": self.api_not_modified + metrics["not_modified"] - seen["not_modified"],
+            "api_retries": self.api_retries + metrics["retries"] - seen["retries"],
+            "api_wait_time": self.api_wait_time + metrics["wait_time"] - seen["wait_time"],
+        }
+        seen.update(metrics)
+        if client.rate_limit_remaining is not None:
+            vals.update({
+                "rate_limit_remaining": client.rate_limit_remaining,
+                "rate_limit_reset": datetime.utcfromtimestamp(client.rate_limit_reset) if client.rate_limit_reset else False,
+            })
+        self.write(vals)
+
+    def _rate_limited(self, client):
+        remaining = client.rate_limit_remaining
+        return remaining is not None and remaining < RATE_LIMIT_RESERVE
+
+    def _commit(self, auto_commit):
+        if auto_commit:
+            self.env.cr.commit()
+
+    def _prepare_wizard_vals(self):
+        vals = {name: self[name] for name in IMPORT_OPTIONS}
+        vals["token"] = self.sudo().token
+        return vals
+
+
+class WebsitePortfolioImportJobLine(models.Model):
+    _name = "website.portfolio.import.job.line"
+    _description = "GitHub Import Job Repository"
+    _order = "sequence, id"
+
+    job_id = fields.Many2one("website.portfolio.import.job", required=True, ondelete="cascade", index=True)
+    sequence = fields.Integer()
+    full_name = fields.Char(string="Repository", readonly=True)
+    meta = fields.Json(readonly=True, help="Repository JSON from the GitHub listing.")
+    status = fields.Selection(
+        selection=[
+            ("pending", "Pending"),
+            ("created", "Created"),
+            ("updated", "Updated"),
+            ("skipped", "Skipped"),
+            ("failed", "Failed"),
+        ],
+        default="pending",
+        required=True,
+        readonly=True,
+    )
+    message = fields.Text(readonly=True)
+    duration = fields.Float(string="Duration (s)", readonly=True, digits=(16, 2))
@@ -1,8 +1,10 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 # -*- coding: utf-8 -*-
+import json
 import re
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
 
 PALETTE = {
   0: "#6c757d",  
@@ -27,6 +29,110 @@ def _slugify(s: str) -> str:
     return s
 
 
+class TagResolver:
+    """Resolve tag names to ids for the duration of one import run.
+
+    All existing tags are read once; missing ones are inserted in a single
+    batch. Names are matched case-insensitively, never by slug: "C", "C++"
+    and "C#" are distinct tags, the later ones get a suffixed slug ("c-2").
+
+    The insert is an ``ON CONFLICT (slug) DO NOTHING`` upsert, so a tag
+    created meanwhile by another import is picked up instead of failing the
+    batch. When that tag was committed after the transaction started,
+    PostgreSQL raises a serialization failure (REPEATABLE READ) and the whole
+    transaction is retried; no tag is ever dropped.
+    """
+
+    def __init__(self, env):
+        self.Tag = env["website.portfolio.tag"].sudo()
+        self.by_name = {}
+        self.by_slug = {}
+        for tag in self.Tag.search_fetch([], ["name", "slug"]):
+            self._remember(tag.name, tag.slug, tag.id)
+
+    def _remember(self, name, slug, tag_id):
+        self.by_name.setdefault(name.casefold(), tag_id)
+        if slug:
+            self.by_slug.setdefault(slug, tag_id)
+
+    def _lookup(self, name):
+        return self.by_name.get(name.casefold())
+
+    def _free_slug(self, name, taken):
+        """First slug of ``name`` unused by the known tags and ``taken``."""
+        base = _slugify(name)
+        if not base:
+            return None
+        slug, n = base, 1
+        while slug in self.by_slug or slug in taken:
+            n += 1
+            slug = f"{base}-{n}"
+        return slug
+
+    def _insert(self, rows):
+        """Insert the (name, slug) rows; return {slug: id} of the inserted ones."""
+        self.Tag.flush_model()
+        cr = self.Tag.env.cr
+        uid = self.Tag.env.uid
+        cr.execute(SQL(
+            """
+            INSERT INTO %s (name, slug, color, create_uid, create_date, write_uid, write_date)
+            VALUES %s
+            ON CONFLICT (slug) DO NOTHING
+            RETURNING slug, id
+            """,
+            SQL.identifier(self.Tag._table),
+            SQL(", ").join(
+                SQL("(%s::jsonb, %s, 0, %s, now() AT TIME ZONE 'UTC', %s, now() AT TIME ZONE 'UTC')",
+                    json.dumps({"en_US": name}), slug, uid, uid)
+                for name, slug in rows
+            ),
+        ))
+        return dict(cr.fetchall())
+
+    def ensure(self, names):
+        """Create the tags missing among ``names`` (one batched insert)."""
+        missing = {}
+        for name in names:
+            if name and not self._lookup(name):
+                missing.setdefault(name.casefold(), name)
+        while missing:
+            taken = set()
+            rows = []
+            for name in missing.values():
+                slug = self._free_slug(name, taken)
+                if not slug:
+                    # no slug, nothing to conflict with
+                    tag = self.Tag.create({"name": name})
+                    self._remember(name, tag.slug, tag.id)
+                    continue
+                taken.add(slug)
+                rows.append((name, slug))
+            if not rows:
+                break
+            inserted = self._insert(rows)
+            for name, slug in rows:
+                if slug in inserted:
+                    self._remember(name, slug, inserted[slug])
+            conflicts = [slug for _name, slug in rows if slug not in inserted]
+            if conflicts:
+                # created meanwhile, under this name or another one: the
+                # latter sends the name to the next free slug
+                for tag in self.Tag.search_fetch([("slug", "in", conflicts)], ["name", "slug"]):
+                    self._remember(tag.name, tag.slug, tag.id)
+            missing = {key: name for key, name in missing.items() if not self._lookup(name)}
+
+    def ids(self, names):
+        """Return the ids of the tags named ``names``, creating missing ones."""
+        self.ensure(names)
+        result = []
+        for name in names:
+            tag_id = self._lookup(name)
+            if tag_id and tag_id not in result:
+                result.append(tag_id)
+        return result
+
+
 class WebsitePortfolioTag(models.Model):
     _name = "website.portfolio.tag"
     _description = "Project Tag"
@@ -68,13 +174,13 @@ class WebsitePortfolioTag(models.Model):
     def create(self, vals_list):
         for vals in vals_list:
             if not vals.get('slug') and vals.get('name'):
-                vals['slug'] = _slugify(vals['name'])
+                vals['slug'] = _slugify(vals['name']) or False
         return super().create(vals_list)
 
     def write(self, vals):
         if 'name' in vals and not vals.get('slug'):
             vals = dict(vals)
-            vals['slug'] = _slugify(vals['name'])
+            vals['slug'] = _slugify(vals['name']) or False
         return super().write(vals)
     
     def _compute_usage_count(self):
@@ -0,0 +1,9 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+
+from . import test_github_client
+from . import test_github_import
+from . import test_portfolio_tag
+from . import test_readme_rewriter
+from . import test_github_benchmark
+from . import test_readme_benchmark
\ No newline at end of file
@@ -0,0 +1,43 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from odoo.tests import TransactionCase
+
+from ..tools.github_cache import GithubHttpCache
+from ..tools.github_client import GithubClient
+from ..wizard.github_import_wizard import GITHUB_FETCH_WORKERS, WebsitePortfolioGithubWizard
+from .github_stub import GithubStub
+
+
+class GithubStubCase(TransactionCase):
+    """Imports run against a local GithubStub instead of api.github.com."""
+
+    repo_count = 0
+    latency = 0.0
+
+    def setUp(self):
+        super().setUp()
+        self.stub = GithubStub(repo_count=self.repo_count, latency=self.latency).start()
+        self.addCleanup(self.stub.stop)
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        stub = self.stub
+
+        def github_client(wizard):
+            return GithubClient(
+                token=wizard.token,
+                pool_size=GITHUB_FETCH_WORKERS,
+                base_url=stub.base_url,
+                cache=GithubHttpCache(cache_dir),
+                backoff=0.01,
+            )
+
+        patcher = patch.object(WebsitePortfolioGithubWizard, "_github_client", github_client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _wizard(self, **vals):
+        return self.env["website.portfolio.github_wizard"].create(dict({"owner": self.stub.owner}, **vals))
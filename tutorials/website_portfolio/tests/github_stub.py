@@ -0,0 +1,131 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+README_HTML = (
+    '<div id="readme"><h1>{name}</h1>'
+    '<p>{name} does <em>one</em> thing well.</p>'
+    '<p><img src="docs/screenshot.png" data-src="docs/lazy.png"> '
+    '<a href="CONTRIBUTING.md">Contributing</a></p></div>'
+)
+
+
+class GithubStub:
+    """Local stand-in of the GitHub REST API, serving the repos of one owner.
+
+    Responses carry an ETag and honour If-None-Match. ``script(path, ...)``
+    queues responses served before the regular ones, e.g. throttling errors.
+    ``rate_limit`` is a (remaining, reset timestamp) pair sent in the
+    X-RateLimit-* headers of every response.
+    """
+
+    def __init__(self, owner="octo", repo_count=0, latency=0.0):
+        self.owner = owner
+        self.latency = latency
+        self.rate_limit = None
+        self.requests = []
+        self._scripts = defaultdict(list)
+        self._lock = threading.Lock()
+        self.repos = [self.repo_meta(f"repo-{i:04d}") for i in range(repo_count)]
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def script(self, path, *responses):
+        """Queue (status, headers, body) responses for ``path``."""
+        with self._lock:
+            self._scripts[path].extend(responses)
+
+    def repo_meta(self, name):
+        return {
+            "name": name,
+            "full_name": f"{self.owner}/{name}",
+            "owner": {"login": self.owner},
+            "html_url": f"https://github.com/{self.owner}/{name}",
+            "description": "",
+            "language": "Python",
+            "topics": ["odoo"],
+            "default_branch": "main",
+            "pushed_at": "2024-01-31T12:00:00Z",
+            "updated_at": "2024-01-31T12:00:00Z",
+        }
+
+    def respond(self, path, query):
+        """Return the (status, headers, body) answer to a GET of ``path``."""
+        with self._lock:
+            self.requests.append(path)
+            if self._scripts.get(path):
+                return self._scripts[path].pop(0)
+        parts = path.strip("/").split("/")
+        if parts == ["users", self.owner]:
+            return 200, {}, {"login": self.owner, "type": "User"}
+        if parts == ["users", self.owner, "repos"]:
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("per_page", ["30"])[0])
+            return 200, {}, self.repos[(page - 1) * per_page:page * per_page]
+        if len(parts) >= 3 and parts[:2] == ["repos", self.owner]:
+            name, what = parts[2], parts[3] if len(parts) > 3 else None
+            if what is None:
+                return 200, {}, self.repo_meta(name)
+            if what == "topics":
+                return 200, {}, {"names": ["odoo", "python"]}
+            if what == "languages":
+                return 200, {}, {"Python": 1000, "JavaScript": 100}
+            if what == "readme":
+                return 200, {"Content-Type": "text/html"}, README_HTML.format(name=name)
+        return 404, {}, {"message": "Not Found"}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                url = urlsplit(self.path)
+                status, headers, body = stub.respond(url.path, parse_qs(url.query))
+                data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+                headers = dict(headers)
+                if status == 200:
+                    etag = '"%s"' % hashlib.sha1(data).hexdigest()
+                    headers.setdefault("ETag", etag)
+                    if self.headers.get("If-None-Match") == etag:
+                        status, data = 304, b""
+                if stub.rate_limit:
+                    remaining, reset = stub.rate_limit
+                    headers.setdefault("X-RateLimit-Remaining", str(remaining))
+                    headers.setdefault("X-RateLimit-Reset", str(int(reset)))
+                headers.setdefault("Content-Type", "application/json")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
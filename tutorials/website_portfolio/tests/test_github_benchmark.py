@@ -0,0 +1,46 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import logging
+import time
+
+from odoo.tests import tagged
+
+from .common import GithubStubCase
+
+_logger = logging.getLogger(__name__)
+
+
+@tagged("-standard", "portfolio_benchmark")
+class TestGithubImportBenchmark(GithubStubCase):
+    """Benchmarks, run on demand with ``--test-tags portfolio_benchmark``.
+
+    The stub answers each request after ``latency`` seconds, standing in for
+    the round-trip to api.github.com.
+    """
+
+    repo_count = 300
+    latency = 0.02
+
+    def _run_job(self, **vals):
+        job = self.env["website.portfolio.import.job"].sudo().create(dict({
+            "name": "Benchmark", "owner": self.stub.owner, "skip_existing": False,
+        }, **vals))
+        start = time.time()
+        job._process(chunk_size=25, deadline=time.time() + 600, auto_commit=False)
+        duration = time.time() - start
+        _logger.info(
+            "portfolio benchmark %s: %s repos in %.2fs (%.1f repos/s), %s requests, %s not modified",
+            job.name, job.repo_total, duration, job.repo_total / duration,
+            job.api_requests, job.api_not_modified,
+        )
+        return job
+
+    def test_import_job_against_stub(self):
+        job = self._run_job(name="first import")
+        self.assertEqual(job.state, "done")
+        self.assertEqual(job.created_count, self.repo_count)
+
+        # nothing changed on GitHub: every call is answered by a 304
+        job = self._run_job(name="forced refresh", force_update=True)
+        self.assertEqual(job.updated_count, self.repo_count)
+        self.assertEqual(job.api_not_modified, job.api_requests)
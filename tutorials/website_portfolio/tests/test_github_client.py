@@ -0,0 +1,92 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import shutil
+import tempfile
+import time
+
+from odoo.tests import BaseCase, tagged
+
+from ..tools.github_cache import GithubHttpCache
+from ..tools.github_client import GithubClient, GithubRateLimited
+from .github_stub import GithubStub
+
+REPO = "/repos/octo/tool"
+
+
+@tagged("post_install", "-at_install")
+class TestGithubClient(BaseCase):
+    """The client against a local GithubStub: retries, conditional requests, pacing."""
+
+    def setUp(self):
+        super().setUp()
+        self.stub = GithubStub().start()
+        self.addCleanup(self.stub.stop)
+
+    def _client(self, **kwargs):
+        client = GithubClient(base_url=self.stub.base_url, backoff=0.01, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_retry_throttled_and_failed_requests(self):
+        self.stub.script(REPO, (429, {"Retry-After": "0"}, {}), (503, {}, {}), (502, {}, {}))
+        client = self._client()
+        self.assertEqual(client.get_repo("octo", "tool")["name"], "tool")
+        self.assertEqual(client.metrics["requests"], 4)
+        self.assertEqual(client.metrics["retries"], 3)
+
+    def test_permission_error_not_retried(self):
+        self.stub.script(REPO, (403, {}, {"message": "Resource not accessible by integration"}))
+        client = self._client()
+        with self.assertRaises(Exception) as catcher:
+            client.get_repo("octo", "tool")
+        self.assertNotIsInstance(catcher.exception, GithubRateLimited)
+        self.assertEqual(client.metrics["requests"], 1)
+
+    def test_rate_limit_exhausted(self):
+        reset = str(int(time.time()) + 3600)
+        self.stub.script(REPO, (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+                                {"message": "API rate limit exceeded"}))
+        client = self._client()
+        with self.assertRaises(GithubRateLimited):
+            client.get_repo("octo", "tool")
+        self.assertEqual(client.metrics["requests"], 1)
+
+    def test_not_modified_served_from_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        client = self._client(cache=GithubHttpCache(cache_dir))
+        first = client.get_topics("octo", "tool")
+        self.assertEqual(client.get_topics("octo", "tool"), first)
+        self.assertEqual(client.metrics["requests"], 2)
+        self.assertEqual(client.metrics["not_modified"], 1)
+
+    def test_retry_after_past_deadline(self):
+        self.stub.script(REPO, (429, {"Retry-After": "30"}, {}))
+        client = self._client(deadline=time.time() + 1)
+        start = time.time()
+        with self.assertRaises(GithubRateLimited):
+            client.get_repo("octo", "tool")
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(client.metrics["wait_time"], 0)
+
+    def test_pacing_stops_at_deadline(self):
+        # 10 calls left for 100 seconds: one request every 10 seconds
+        self.stub.rate_limit = (10, time.time() + 100)
+        client = self._client(deadline=time.time() + 2)
+        client.get_repo("octo", "tool")
+        start = time.time()
+        client.get_repo("octo", "tool")  # first paced slot, right away
+        with self.assertRaises(GithubRateLimited):
+            client.get_repo("octo", "tool")
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(len(self.stub.requests), 2)
+
+    def test_pacing_spreads_requests(self):
+        # 50 calls left for 5 seconds: one request every 0.1 second
+        self.stub.rate_limit = (50, time.time() + 5)
+        client = self._client()
+        client.get_repo("octo", "tool")
+        start = time.time()
+        for _i in range(5):
+            client.get_repo("octo", "tool")
+        self.assertGreaterEqual(time.time() - start, 0.35)
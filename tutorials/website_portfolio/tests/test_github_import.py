@@ -0,0 +1,71 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import time
+from unittest.mock import patch
+
+from odoo.tests import new_test_user, tagged
+
+from ..tools.github_client import GithubClient
+from .common import GithubStubCase
+
+
+@tagged("post_install", "-at_install")
+class TestGithubImport(GithubStubCase):
+
+    def test_action_import_closes_its_client(self):
+        with patch.object(GithubClient, "close", autospec=True, side_effect=GithubClient.close) as close:
+            action = self._wizard(repo="tool", skip_existing=False).action_import()
+        self.assertEqual(close.call_count, 1)
+
+        project = self.env["website.portfolio"].browse(action["res_id"])
+        self.assertEqual(project.github_full_name, "octo/tool")
+        self.assertIn("https://raw.githubusercontent.com/octo/tool/main/docs/screenshot.png",
+                      project.description_long)
+        self.assertEqual(sorted({name.lower() for name in project.tag_ids.mapped("name")}), ["odoo", "python"])
+        self.assertEqual(self.stub.requests, [
+            "/repos/octo/tool", "/repos/octo/tool/topics", "/repos/octo/tool/readme",
+        ])
+
+
+@tagged("post_install", "-at_install")
+class TestGithubImportJob(GithubStubCase):
+
+    repo_count = 3
+
+    def _job(self):
+        return self.env["website.portfolio.import.job"].sudo().create({
+            "name": "Import", "owner": self.stub.owner, "skip_existing": False,
+        })
+
+    def test_action_import_all_queues_normalized_owner(self):
+        user = new_test_user(self.env, login="portfolio_importer", groups="base.group_user")
+        # a plain internal user may create the wizard, not write on it
+        wizard = self.env["website.portfolio.github_wizard"].with_user(user).create({
+            "owner": f"https://github.com/{self.stub.owner}/",
+        })
+        action = wizard.action_import_all()
+
+        job = self.env["website.portfolio.import.job"].browse(action["res_id"])
+        self.assertEqual(job.owner, self.stub.owner)
+        self.assertEqual(job.name, f"Import of {self.stub.owner}")
+        self.assertEqual(wizard.owner, f"https://github.com/{self.stub.owner}/")
+
+    def test_throttled_repos_stay_pending(self):
+        self.stub.script("/repos/octo/repo-0001/topics", (429, {"Retry-After": "600"}, {}))
+        job = self._job()
+        job._process(chunk_size=25, deadline=time.time() + 30, auto_commit=False)
+
+        statuses = {line.full_name: line.status for line in job.line_ids}
+        self.assertEqual(statuses, {
+            "octo/repo-0000": "created",
+            "octo/repo-0001": "pending",
+            "octo/repo-0002": "created",
+        })
+        self.assertEqual(job.state, "running")
+        self.assertEqual((job.repo_done, job.created_count, job.failed_count), (2, 2, 0))
+
+        # the next run imports it
+        job._process(chunk_size=25, deadline=time.time() + 30, auto_commit=False)
+        self.assertEqual(job.state, "done")
+        self.assertEqual(set(job.line_ids.mapped("status")), {"created"})
+        self.assertEqual((job.repo_done, job.created_count), (3, 3))
@@ -0,0 +1,73 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+from psycopg2.errors import SerializationFailure
+
+from odoo import SUPERUSER_ID, api
+from odoo.modules.registry import Registry
+from odoo.tests import BaseCase, TransactionCase, get_db_name, tagged
+
+from ..models.website_portfolio_tag import TagResolver
+
+
+@tagged("post_install", "-at_install")
+class TestTagResolver(TransactionCase):
+
+    def test_look_alike_names_are_distinct_tags(self):
+        resolver = TagResolver(self.env)
+        ids = resolver.ids(["C", "C++", "C#"])
+        self.assertEqual(len(ids), 3)
+        tags = self.env["website.portfolio.tag"].browse(ids)
+        self.assertEqual(tags.mapped("name"), ["C", "C++", "C#"])
+        self.assertEqual(tags.mapped("slug"), ["c", "c-2", "c-3"])
+
+    def test_slug_taken_by_existing_tag(self):
+        existing = self.env["website.portfolio.tag"].create({"name": "C"})
+        [csharp] = TagResolver(self.env).ids(["C#"])
+        self.assertNotEqual(csharp, existing.id)
+        self.assertEqual(self.env["website.portfolio.tag"].browse(csharp).slug, "c-2")
+
+    def test_names_match_case_insensitively(self):
+        existing = self.env["website.portfolio.tag"].create({"name": "Python"})
+        resolver = TagResolver(self.env)
+        self.assertEqual(resolver.ids(["python", "PYTHON", "Python"]), [existing.id])
+
+    def test_name_without_slug(self):
+        ids = TagResolver(self.env).ids(["日本語", "日本語"])
+        self.assertEqual(len(ids), 1)
+        self.assertFalse(self.env["website.portfolio.tag"].browse(ids).slug)
+
+
+@tagged("post_install", "-at_install")
+class TestTagResolverConcurrency(BaseCase):
+    """Two imports creating the same tag, from separate committed cursors."""
+
+    def setUp(self):
+        super().setUp()
+        self.registry = Registry(get_db_name())
+        self.addCleanup(self._cleanup)
+
+    def _cleanup(self):
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            env["website.portfolio.tag"].search([("slug", "=", "concurrent-tag")]).unlink()
+
+    def test_tag_committed_after_snapshot_is_not_dropped(self):
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            # starts the snapshot of this transaction
+            resolver = TagResolver(env)
+
+            with self.registry.cursor() as other_cr:
+                other_env = api.Environment(other_cr, SUPERUSER_ID, {})
+                tag_id = TagResolver(other_env).ids(["Concurrent Tag"])[0]
+
+            # the committed tag is invisible to the snapshot: the transaction
+            # must be retried rather than import the project without its tag
+            with self.assertRaises(SerializationFailure):
+                resolver.ids(["Concurrent Tag"])
+            cr.rollback()
+
+        # the retry sees the tag
+        with self.registry.cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            self.assertEqual(TagResolver(env).ids(["Concurrent Tag"]), [tag_id])
@@ -0,0 +1,88 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import logging
+import re
+import time
+
+from odoo.tests import BaseCase, tagged
+
+from ..tools.readme_rewriter import first_paragraph_text, rewrite_links, rewrite_readme, to_raw_url
+
+_logger = logging.getLogger(__name__)
+
+
+def legacy_rewrite(html, owner, repo, branch):
+    """The former implementation: one full-document re.sub per attribute."""
+    html = re.sub(
+        r'(<img\b[^>]*\bsrc=)("|\')(.*?)(\2)',
+        lambda m: m.group(1) + m.group(2) + to_raw_url(m.group(3), owner, repo, branch) + m.group(4),
+        html, flags=re.I | re.S,
+    )
+    html = re.sub(
+        r'(<a\b[^>]*\bhref=)("|\')(.*?)(\2)',
+        lambda m: m.group(1) + m.group(2) + to_raw_url(m.group(3), owner, repo, branch) + m.group(4),
+        html, flags=re.I | re.S,
+    )
+    m = re.search(r"<p[^>]*>(.*?)</p>", html, flags=re.I | re.S)
+    text = re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", m.group(1) if m else html)).strip()
+    return html, text[:240]
+
+
+def single_pass(html, owner, repo, branch):
+    """rewrite_readme without its memo."""
+    html = rewrite_links(html, owner, repo, branch)
+    return html, first_paragraph_text(html)
+
+
+def readme_corpus(count=200, sections=40):
+    """READMEs shaped like GitHub's rendering: headings, badges, images, links, code."""
+    corpus = []
+    for i in range(count):
+        parts = [f'<div id="readme"><h1>Project {i}</h1><p>Project {i} does <em>one</em> thing well.</p>']
+        for s in range(sections):
+            parts.append(
+                f'<h2><a id="user-content-s{s}" class="anchor" href="#s{s}">Section {s}</a></h2>'
+                f'<p><a href="https://github.com/octo/p{i}/actions"><img alt="ci" src="https://img.shields.io/badge/{s}.svg"></a> '
+                f'See <a href="docs/guide-{s}.md">the guide</a> and '
+                f'<a href="https://github.com/octo/p{i}/blob/main/examples/{s}.py">example</a>.</p>'
+                f'<p><img src="docs/img/shot-{s}.png" alt="screenshot" width="600"></p>'
+                f'<pre><code>pip install project-{i}\nproject --run {s} &gt; out.txt</code></pre>'
+            )
+        parts.append('</div>')
+        corpus.append("".join(parts))
+    return corpus
+
+
+@tagged("-standard", "portfolio_benchmark")
+class TestReadmeBenchmark(BaseCase):
+    """Benchmarks, run on demand with ``--test-tags portfolio_benchmark``."""
+
+    def _time(self, func, corpus, rounds=3):
+        best = None
+        for _round in range(rounds):
+            start = time.perf_counter()
+            results = [func(html, "octo", f"p{i}", "main") for i, html in enumerate(corpus)]
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        return results, best
+
+    def test_readme_rewrite_corpus(self):
+        corpus = readme_corpus()
+        size = sum(len(html) for html in corpus)
+
+        legacy, legacy_time = self._time(legacy_rewrite, corpus)
+        single, single_time = self._time(single_pass, corpus)
+        # the memo is cold on the first call only, time it apart from the hits
+        memo_cold_start = time.perf_counter()
+        for i, html in enumerate(corpus):
+            rewrite_readme(html + " ", "octo", f"p{i}", "main")
+        memo_cold = time.perf_counter() - memo_cold_start
+        _memo, memo_hit = self._time(lambda html, *args: rewrite_readme(html + " ", *args), corpus)
+
+        _logger.info(
+            "portfolio benchmark README rewrite, %s documents (%.1f MB): legacy %.3fs, single pass %.3fs, "
+            "memo cold %.3fs, memo hit %.3fs",
+            len(corpus), size / 1e6, legacy_time, single_time, memo_cold, memo_hit,
+        )
+        # without data-* attributes both produce the same documents
+        self.assertEqual(single, legacy)
@@ -0,0 +1,74 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+from unittest.mock import patch
+
+from odoo.tests import BaseCase, tagged
+
+from ..tools import readme_rewriter
+from ..tools.readme_rewriter import first_paragraph_text, rewrite_links, rewrite_readme
+
+RAW = "https://raw.githubusercontent.com/octo/tool/main"
+
+
+@tagged("post_install", "-at_install")
+class TestReadmeRewriter(BaseCase):
+
+    def _rewrite(self, html):
+        return rewrite_links(html, "octo", "tool", "main")
+
+    def test_relative_links(self):
+        self.assertEqual(
+            self._rewrite('<p><img alt="x" src="docs/a.png"> <a href="/CONTRIBUTING.md">c</a></p>'),
+            f'<p><img alt="x" src="{RAW}/docs/a.png"> <a href="{RAW}/CONTRIBUTING.md">c</a></p>',
+        )
+
+    def test_absolute_links(self):
+        html = '<a href="https://example.com/x">x</a><a href="mailto:me@example.com">m</a>'
+        self.assertEqual(self._rewrite(html), html)
+        self.assertEqual(
+            self._rewrite("<IMG SRC='https://github.com/o/r/blob/dev/img/logo.svg'>"),
+            "<IMG SRC='https://raw.githubusercontent.com/o/r/dev/img/logo.svg'>",
+        )
+
+    def test_data_attributes_untouched(self):
+        self.assertEqual(
+            self._rewrite('<img data-src="lazy.png" src="a.png"><img src="b.png" data-src="lazy.png">'),
+            f'<img data-src="lazy.png" src="{RAW}/a.png"><img src="{RAW}/b.png" data-src="lazy.png">',
+        )
+        self.assertEqual(
+            self._rewrite('<a data-href="x" href="y.md">y</a><img data-src="only.png">'),
+            f'<a data-href="x" href="{RAW}/y.md">y</a><img data-src="only.png">',
+        )
+
+    def test_other_tags_untouched(self):
+        html = '<source src="v.mp4"><link href="s.css"><abbr href="x">'
+        self.assertEqual(self._rewrite(html), html)
+
+    def test_first_paragraph(self):
+        html = '<h1>Tool</h1><p>Does <em>one</em>\n thing.</p><p>More.</p>'
+        self.assertEqual(first_paragraph_text(html), "Does one thing.")
+        self.assertEqual(first_paragraph_text(html, max_len=4), "Does")
+
+    def test_rewrite_readme_memo(self):
+        html = '<p>Tool <img src="a.png"></p>'
+        result = rewrite_readme(html, "octo", "tool", "main")
+        self.assertEqual(result, (f'<p>Tool <img src="{RAW}/a.png"></p>', "Tool"))
+        self.assertIs(rewrite_readme(html, "octo", "tool", "main"), result)
+        self.assertEqual(rewrite_readme(html, "octo", "tool", "dev")[0], f'<p>Tool <img src="{RAW[:-4]}dev/a.png"></p>')
+
+    def test_rewrite_readme_memo_bounded_by_size(self):
+        readmes = [f'<p>Tool {i} <img src="a.png"></p>' + "x" * 100 for i in range(10)]
+        size = len(rewrite_readme(readmes[0], "octo", "bounded", "main")[0]) + len("Tool 0")
+        with patch.object(readme_rewriter, "MEMO_BYTES", 3 * size), \
+                patch.object(readme_rewriter, "_memo", readme_rewriter.OrderedDict()), \
+                patch.object(readme_rewriter, "_memo_bytes", 0):
+            results = [rewrite_readme(html, "octo", "bounded", "main") for html in readmes]
+            self.assertLessEqual(readme_rewriter._memo_bytes, 3 * size)
+            self.assertEqual(len(readme_rewriter._memo), 3)
+            # the most recent results are kept, the oldest ones are evicted
+            self.assertIs(rewrite_readme(readmes[-1], "octo", "bounded", "main"), results[-1])
+            self.assertIsNot(rewrite_readme(readmes[0], "octo", "bounded", "main"), results[0])
+
+            # a result larger than the whole memo is not kept
+            rewrite_readme("<p>" + "y" * 4 * size + "</p>", "octo", "bounded", "main")
+            self.assertLessEqual(readme_rewriter._memo_bytes, 3 * size)
@@ -0,0 +1,56 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import tempfile
+
+
+class GithubHttpCache:
+    """File store of GitHub responses, keyed by request, for conditional requests.
+
+    Each entry keeps the validators (ETag / Last-Modified) and the body of the
+    last 200 response. Entries are single JSON files written atomically, so
+    concurrent fetch threads (and workers) can share the directory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def key(url, params=None, accept=None, token=None):
+        parts = [url, json.dumps(params or {}, sort_keys=True), accept or ""]
+        if token:
+            # responses may depend on the credentials (private repositories)
+            parts.append(hashlib.sha256(token.encode()).hexdigest())
+        return hashlib.sha1("\n".join(parts).encode()).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, etag, last_modified, body, headers=None):
+        if not (etag or last_modified):
+            return
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+            "headers": headers or {},
+        }
+        fname = self._file(key)
+        os.makedirs(os.path.dirname(fname), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(fname), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, fname)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
@@ -0,0 +1,293 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import logging
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from odoo import _
+from odoo.exceptions import UserError
+
+_logger = logging.getLogger(__name__)
+
+GITHUB_API = "https://api.github.com"
+
+RETRY_STATUSES = {403, 429, 500, 502, 503, 504}
+
+
+class GithubRateLimited(UserError):
+    """The rate limit leaves no room for the request before the caller's deadline."""
+
+
+class GithubClient:
+    """Plain HTTP client of the GitHub REST API.
+
+    It never touches the ORM, so it can be shared by the threads that fetch
+    repository details. One keep-alive ``requests.Session`` serves all calls.
+    With a ``cache`` (see GithubHttpCache) GET requests are conditional: a 304
+    answer is served from the cached body as if it were a 200.
+
+    Requests are paced from the X-RateLimit-* headers so the remaining budget
+    lasts until the reset, and throttled (403/429) or failed (5xx, network
+    errors) requests are retried with jittered exponential backoff.
+
+    No wait goes past ``deadline`` (a timestamp, e.g. the end of a cron run):
+    GithubRateLimited is raised instead, as it is when GitHub keeps
+    throttling, so callers can tell "try again later" from a failure.
+    """
+
+    def __init__(self, token=None, timeout=20, pool_size=10, base_url=GITHUB_API, cache=None,
+                 max_retries=4, backoff=1.0, max_wait=300, pace_below=100, deadline=None):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cache = cache
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_wait = max_wait        # longest single wait before giving up, in seconds
+        self.pace_below = pace_below    # start spacing requests under this many calls left
+        self.deadline = deadline        # no wait ends after this timestamp
+        self._token = token
+        # last rate-limit state reported by GitHub
+        self.rate_limit_remaining = None
+        self.rate_limit_reset = None
+        self._lock = threading.Lock()
+        self._next_slot = 0.0   # earliest start of the next paced request
+        self._metrics = {"requests": 0, "not_modified": 0, "retries": 0, "wait_time": 0.0}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "odoo-website-portfolio",
+        })
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, url, params=None, accept=None, timeout=None):
+        headers = {"Accept": accept} if accept else {}
+        key = entry = None
+        if self.cache:
+            key = self.cache.key(url, params, accept, self._token)
+            entry = self.cache.get(key)
+            if entry:
+                if entry.get("etag"):
+                    headers["If-None-Match"] = entry["etag"]
+                if entry.get("last_modified"):
+                    headers["If-Modified-Since"] = entry["last_modified"]
+
+        r = self._request(url, params, headers, timeout or self.timeout)
+
+        if r.status_code == 304 and entry:
+            return self._cached_response(r, entry)
+        if key and r.status_code == 200:
+            self.cache.set(
+                key, r.headers.get("ETag"), r.headers.get("Last-Modified"), r.text,
+                {"Content-Type": r.headers.get("Content-Type", "")},
+            )
+        return r
+
+    @property
+    def metrics(self):
+        """Counters since the client was created: requests, not_modified, retries, wait_time."""
+        with self._lock:
+            return dict(self._metrics)
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self._metrics[name] += value
+
+    def _sleep(self, seconds):
+        if seconds <= 0:
+            return
+        self._count("wait_time", seconds)
+        time.sleep(seconds)
+
+    def _request(self, url, params, headers, timeout):
+        """GET with rate-limit pacing and retries of throttled or failed requests."""
+        attempt = 0
+        while True:
+            self._pace()
+            self._count("requests")
+            try:
+                r = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._backoff_delay(attempt)
+                if attempt >= self.max_retries or self._past_deadline(delay):
+                    raise UserError(_("GitHub request failed: %s") % e)
+            else:
+                self._update_rate_limit(r)
+                if r.status_code == 304:
+                    self._count("not_modified")
+                delay = self._retry_delay(r, attempt)
+                if delay is not None and self._past_deadline(delay):
+                    delay = None
+                if delay is None:
+                    if self._is_throttled(r):
+                        raise GithubRateLimited(_("GitHub API rate limit reached (%s), try again later.")
+                                                % r.status_code)
+                    return r
+            attempt += 1
+            self._count("retries")
+            _logger.info("website_portfolio: retrying %s in %.1fs (attempt %s)", url, delay, attempt)
+            self._sleep(delay)
+
+    def _update_rate_limit(self, r):
+        if "X-RateLimit-Remaining" in r.headers:
+            with self._lock:
+                self.rate_limit_remaining = int(r.headers["X-RateLimit-Remaining"])
+                self.rate_limit_reset = int(r.headers.get("X-RateLimit-Reset") or 0)
+
+    def _past_deadline(self, delay):
+        return self.deadline is not None and time.time() + delay > self.deadline
+
+    @staticmethod
+    def _is_throttled(r):
+        """Whether ``r`` is a rate-limit answer, as opposed to e.g. a permission error."""
+        if r.status_code == 429:
+            return True
+        return r.status_code == 403 and bool(
+            r.headers.get("Retry-After") or r.headers.get("X-RateLimit-Remaining") == "0"
+            or "rate limit" in r.text.lower())
+
+    def _backoff_delay(self, attempt):
+        return min(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5), self.max_wait)
+
+    def _retry_delay(self, r, attempt):
+        """Seconds to wait before retrying ``r``, or None when it is final."""
+        if r.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        if r.status_code == 403 and not self._is_throttled(r):
+            # a plain permission error, not a throttled request
+            return None
+        retry_after = r.headers.get("Retry-After")
+        if retry_after:
+            delay = float(retry_after) if retry_after.isdigit() else self._backoff_delay(attempt)
+        elif r.headers.get("X-RateLimit-Remaining") == "0":
+            delay = int(r.headers.get("X-RateLimit-Reset") or 0) - time.time() + 1
+        else:
+            delay = self._backoff_delay(attempt)
+        if delay > self.max_wait:
+            return None
+        return max(delay, 0)
+
+    def _pace(self):
+        """Spread the remaining rate-limit budget evenly until its reset.
+
+        Paced requests get consecutive time slots, shared by all threads. A
+        slot past the deadline raises GithubRateLimited without waiting.
+        """
+        with self._lock:
+            remaining, reset = self.rate_limit_remaining, self.rate_limit_reset
+            if remaining is None or not reset or remaining >= self.pace_below:
+                return
+            now = time.time()
+            until_reset = reset - now
+            if until_reset <= 0:
+                return
+            interval = until_reset / max(remaining, 1)
+            if interval > self.max_wait:
+                raise GithubRateLimited(_("GitHub API rate limit exhausted, it resets in %s minutes.")
+                                        % int(until_reset // 60 + 1))
+            slot = max(now, self._next_slot)
+            if self.deadline is not None and slot > self.deadline:
+                raise GithubRateLimited(_("GitHub API rate limit: no request left before the end of this run."))
+            self._next_slot = slot + interval
+        self._sleep(slot - now)
+
+    @staticmethod
+    def _cached_response(not_modified, entry):
+        """Turn a 304 answer into a 200 carrying the cached body."""
+        r = requests.Response()
+        r.status_code = 200
+        r.url = not_modified.url
+        r.request = not_modified.request
+        r.headers = CaseInsensitiveDict(entry.get("headers") or {})
+        r.headers.update(not_modified.headers)
+        r.encoding = "utf-8"
+        r._content = (entry.get("body") or "").encode("utf-8")
+        r.from_cache = True
+        return r
+
+    # -------- Endpoints --------
+
+    def get_repo(self, owner, repo):
+        r = self.get(f"{self.base_url}/repos/{owner}/{repo}")
+        if r.status_code == 404:
+            raise UserError(_("Repository not found or private. Check owner/repo and token."))
+        if r.status_code != 200:
+            raise UserError(_("GitHub repo fetch failed (%s): %s") % (r.status_code, r.text))
+        return r.json()
+
+    def _check(self, r, what):
+        """Raise on a failed response; throttling was already retried."""
+        if r.status_code != 200:
+            raise UserError(_("GitHub %s fetch failed (%s): %s") % (what, r.status_code, r.text))
+
+    def get_topics(self, owner, repo):
+        r = self.get(f"{self.base_url}/repos/{owner}/{repo}/topics")
+        if r.status_code == 404:
+            return []
+        self._check(r, "topics")
+        data = r.json() or {}
+        return data.get("names", []) or []
+
+    def get_languages(self, owner, repo):
+        r = self.get(f"{self.base_url}/repos/{owner}/{repo}/languages")
+        if r.status_code == 404:
+            return []
+        self._check(r, "languages")
+        return list((r.json() or {}).keys())
+
+    def get_readme_html(self, owner, repo):
+        r = self.get(f"{self.base_url}/repos/{owner}/{repo}/readme", accept="application/vnd.github.html")
+        if r.status_code == 404:
+            # no README
+            return ""
+        self._check(r, "README")
+        return r.text or ""
+
+    def iter_owner_repos(self, owner, include_private=False):
+        """Yield repo JSON for user/org with pagination."""
+        u = self.get(f"{self.base_url}/users/{owner}")
+        if u.status_code == 404:
+            raise UserError(_("GitHub owner not found: %s") % owner)
+        if u.status_code != 200:
+            raise UserError(_("Owner lookup failed (%s): %s") % (u.status_code, u.text))
+        is_org = (u.json().get("type") == "Organization")
+
+        base = f"{self.base_url}/orgs/{owner}/repos" if is_org else f"{self.base_url}/users/{owner}/repos"
+        params = {
+            "per_page": 100,
+            "type": "all" if include_private else "public",
+            "sort": "full_name",
+            "direction": "asc",
+        }
+        page = 1
+        while True:
+            params["page"] = page
+            r = self.get(base, params=params, timeout=30)
+            if r.status_code in (401, 403) and include_private:
+                raise UserError(_("Including private repositories requires a token with 'repo' scope."))
+            if r.status_code != 200:
+                raise UserError(_("Repo listing failed (%s): %s") % (r.status_code, r.text))
+            items = r.json() or []
+            if not items:
+                break
+            for meta in items:
+                yield meta
+            if len(items) < 100:
+                break
+            page += 1
@@ -0,0 +1,98 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+# -*- coding: utf-8 -*-
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+RAW_BASE = "https://raw.githubusercontent.com"
+
+# one scan over the document visits every <img>/<a> start tag
+LINK_TAG_RE = re.compile(r"<(img|a)\b[^>]*>", re.I)
+# the attribute itself, not the end of another one such as data-src=
+LINK_ATTR_RE = {
+    "img": re.compile(r"((?<![\w-])src=)(\"|')(.*?)(\2)", re.I | re.S),
+    "a": re.compile(r"((?<![\w-])href=)(\"|')(.*?)(\2)", re.I | re.S),
+}
+BLOB_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)", re.S)
+FIRST_P_RE = re.compile(r"<p[^>]*>(.*?)</p>", re.I | re.S)
+TAG_RE = re.compile(r"<[^>]+>")
+SPACES_RE = re.compile(r"\s+")
+
+MEMO_BYTES = 8 * 1024 * 1024  # size of the memoized results per worker, in characters
+_memo = OrderedDict()
+_memo_bytes = 0
+_memo_lock = threading.Lock()
+
+
+def to_raw_url(url, owner, repo, branch):
+    """Make a README link absolute, pointing to raw GitHub content."""
+    if not url:
+        return url
+    u = url.strip()
+    # already absolute
+    if u.startswith(("http://", "https://", "mailto:")):
+        # convert github "blob" to raw if present
+        m = BLOB_RE.match(u)
+        if m:
+            o, r, br, path = m.groups()
+            return f"{RAW_BASE}/{o}/{r}/{br}/{path}"
+        return u
+    # root-relative or relative path -> raw content
+    return f"{RAW_BASE}/{owner}/{repo}/{branch}/{u.lstrip('/')}"
+
+
+def rewrite_links(html, owner, repo, branch):
+    """Make README <img src> and <a href> absolute to raw GitHub, in one pass."""
+    if not html:
+        return html
+
+    def rewrite_attr(m):
+        return m.group(1) + m.group(2) + to_raw_url(m.group(3), owner, repo, branch) + m.group(4)
+
+    def rewrite_tag(m):
+        return LINK_ATTR_RE[m.group(1).lower()].sub(rewrite_attr, m.group(0), count=1)
+
+    return LINK_TAG_RE.sub(rewrite_tag, html)
+
+
+def first_paragraph_text(html, max_len=240):
+    """Return first readable paragraph from README HTML."""
+    if not html:
+        return ""
+    m = FIRST_P_RE.search(html)
+    body = m.group(1) if m else html
+    text = SPACES_RE.sub(" ", TAG_RE.sub(" ", body)).strip()
+    return text[:max_len]
+
+
+def rewrite_readme(html, owner, repo, branch, max_len=240):
+    """Return ``(html, first_paragraph_text)`` of a README rendered by GitHub.
+
+    Results are memoized per (repo, branch, content hash), so unchanged
+    READMEs are not processed again by later syncs in the same worker. The
+    memo is bounded by the size of the results it keeps, MEMO_BYTES.
+    """
+    global _memo_bytes
+    if not html:
+        return html, ""
+    key = (owner, repo, branch, max_len, hashlib.sha1(html.encode()).digest())
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key]
+
+    rewritten = rewrite_links(html, owner, repo, branch)
+    result = (rewritten, first_paragraph_text(rewritten, max_len))
+
+    size = len(rewritten) + len(result[1])
+    if size > MEMO_BYTES:
+        return result
+    with _memo_lock:
+        if key not in _memo:
+            _memo[key] = result
+            _memo_bytes += size
+        while _memo_bytes > MEMO_BYTES:
+            _key, (old_html, old_text) = _memo.popitem(last=False)
+            _memo_bytes -= len(old_html) + len(old_text)
+    return result
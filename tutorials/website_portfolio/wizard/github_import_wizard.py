@@ -1,25 +1,35 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 # -*- coding: utf-8 -*-
+import logging
+import os
 import re
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from urllib.parse import urlparse
+from psycopg2.errors import SerializationFailure
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError
+from odoo.tools import config
 
-GITHUB_API = "https://api.github.com"
+from ..models.website_portfolio_tag import TagResolver
+from ..tools.github_cache import GithubHttpCache
+from ..tools.github_client import GithubClient, GithubRateLimited
+from ..tools.readme_rewriter import rewrite_readme
+
+_logger = logging.getLogger(__name__)
+
+# concurrent per-repo fetches (topics, languages, README) during "Import All"
+GITHUB_FETCH_WORKERS = 8
 
 QUARANTINE_TAG = "Quarantine"
 NO_MD_TAG = "NoMD"
 
-def _first_paragraph_text(html: str, max_len: int = 240) -> str:
-    """Return first readable paragraph from README HTML."""
-    if not html:
-        return ""
-    m = re.search(r"<p[^>]*>(.*?)</p>", html, flags=re.I | re.S)
-    body = m.group(1) if m else html
-    text = re.sub(r"<[^>]+>", " ", body)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text[:max_len]
+def _github_datetime(value):
+    """Parse a GitHub ISO timestamp ('2024-01-31T12:00:00Z') to a naive UTC datetime."""
+    if not value:
+        return False
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
 
 class WebsitePortfolioGithubWizard(models.TransientModel):
     _name = "website.portfolio.github_wizard"
@@ -39,6 +49,10 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
     include_private = fields.Boolean(string="Include private (requires token)")
     skip_existing = fields.Boolean(string="Skip existing repos", default=True)
     fetch_readme = fields.Boolean(string="Fetch README content", default=True)
+    force_update = fields.Boolean(
+        string="Refresh unchanged repos",
+        help="Also update repos not pushed or modified since the last import.",
+    )
 
     @api.onchange('publish_now')
     def _onchange_publish_now(self):
@@ -47,48 +61,17 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
             self.publish_to = False
 
     # ---------------- Helpers ----------------
-    @staticmethod
-    def _rewrite_github_links(html: str, owner: str, repo: str, default_branch: str) -> str:
-        """Make README <img src> and <a href> absolute to raw GitHub."""
-        if not html:
-            return html
-
-        def to_raw(url: str) -> str:
-            if not url:
-                return url
-            u = url.strip() 
-            # already absolute
-            if u.startswith(("http://", "https://", "mailto:")):
-                # convert github "blob" to raw if present
-                m = re.match(r"https?://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.*)", u)
-                if m:
-                    o, r, br, path = m.groups()
-                    return f"https://raw.githubusercontent.com/{o}/{r}/{br}/{path}"
-                return u    
-            # root-relative or relative path -> raw content
-            u = u.lstrip("/")  # drop any leading slash
-            return f"https://raw.githubusercontent.com/{owner}/{repo}/{default_branch}/{u}"
-
-        # src=""
-        html = re.sub(
-            r'(<img\b[^>]*\bsrc=)("|\')(.*?)(\2)',
-            lambda m: m.group(1) + m.group(2) + to_raw(m.group(3)) + m.group(4),
-            html, flags=re.I | re.S
-        )
-        # href="" (use raw for direct file links)
-        html = re.sub(
-            r'(<a\b[^>]*\bhref=)("|\')(.*?)(\2)',
-            lambda m: m.group(1) + m.group(2) + to_raw(m.group(3)) + m.group(4),
-            html, flags=re.I | re.S
+    def _github_client(self):
+        return GithubClient(
+            token=self.token,
+            pool_size=GITHUB_FETCH_WORKERS,
+            cache=self._github_http_cache(),
         )
-        return html
 
-
-    def _headers(self):
-        h = {"Accept": "application/vnd.github+json", "User-Agent": "odoo-website-portfolio"}
-        if self.token:
-            h["Authorization"] = f"Bearer {self.token}"
-        return h
+    def _github_http_cache(self):
+        """ETag cache of the GitHub API responses, kept in the database filestore."""
+        path = os.path.join(config.filestore(self.env.cr.dbname), "website_portfolio", "github")
+        return GithubHttpCache(path)
 
     def _normalize_owner_repo(self, owner: str, repo: str):
         """Accept owner, owner/repo, https URL, ssh URL; strip .git."""
@@ -117,22 +100,6 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
 
         return owner.strip(), strip_git(repo)
 
-    # Topics & languages
-    def _get_topics(self, owner, repo):
-        url = f"{GITHUB_API}/repos/{owner}/{repo}/topics"
-        r = requests.get(url, headers=self._headers(), timeout=20)
-        if r.status_code == 200:
-            data = r.json() or {}
-            return data.get("names", []) or []
-        return []
-
-    def _get_languages(self, owner, repo):
-        url = f"{GITHUB_API}/repos/{owner}/{repo}/languages"
-        r = requests.get(url, headers=self._headers(), timeout=20)
-        if r.status_code == 200:
-            return list((r.json() or {}).keys())
-        return []
-
     def _normalize_tag(self, s: str):
         if not s:
             return ""
@@ -142,33 +109,45 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
             return "C#"
         return name
 
-    def _get_repo(self, owner, repo):
-        url = f"{GITHUB_API}/repos/{owner}/{repo}"
-        r = requests.get(url, headers=self._headers(), timeout=20)
-        if r.status_code == 404:
-            raise UserError(_("Repository not found or private. Check owner/repo and token."))
-        if r.status_code != 200:
-            raise UserError(_("GitHub repo fetch failed (%s): %s") % (r.status_code, r.text))
-        return r.json()
-
-    def _get_readme_html(self, owner, repo):
-        url = f"{GITHUB_API}/repos/{owner}/{repo}/readme"
-        headers = self._headers(); headers["Accept"] = "application/vnd.github.html"
-        r = requests.get(url, headers=headers, timeout=20)
-        return r.text if r.status_code == 200 and r.text else ""
-
-    def _collect_tag_names(self, meta, owner_login, repo_name):
+    def _fetch_options(self):
+        """Wizard options needed by the fetch threads, as plain values."""
+        return {
+            "topics": self.import_topics,
+            "languages": self.import_all_languages,
+            "readme": self.fetch_readme,
+        }
+
+    @staticmethod
+    def _fetch_repo_extras(client, meta, options):
+        """Fetch topics, languages and README of a repo.
+
+        Runs in the fetch threads: HTTP only, no ORM access.
+        """
+        owner_login = (meta.get("owner") or {}).get("login") or ""
+        repo_name = meta.get("name") or ""
+        extras = {}
+        if not (owner_login and repo_name):
+            return extras
+        if options["topics"]:
+            extras["topics"] = client.get_topics(owner_login, repo_name)
+        if options["languages"]:
+            extras["languages"] = client.get_languages(owner_login, repo_name)
+        if options["readme"]:
+            extras["readme_html"] = client.get_readme_html(owner_login, repo_name)
+        return extras
+
+    def _collect_tag_names(self, meta, extras):
         """Collect tag names from topics and languages based on options."""
         names = []
 
         if self.import_topics:
-            topics = self._get_topics(owner_login, repo_name)
+            topics = extras.get("topics")
             if not topics:
                 topics = meta.get("topics") or []
             names.extend(topics)
 
         if self.import_all_languages:
-            names.extend(self._get_languages(owner_login, repo_name))
+            names.extend(extras.get("languages") or [])
         elif self.import_primary_language:
             lang = meta.get("language")
             if lang:
@@ -183,10 +162,16 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
         return norm
 
     def _upsert_from_meta(self, meta, publish_now, publish_from, publish_to,
-                          fetch_readme, skip_existing):
-        """Create or update a project record from a repo JSON."""
+                          fetch_readme, skip_existing, extras=None, tags=None, client=None):
+        """Create or update a project record from a repo JSON.
+
+        ``extras`` holds the already fetched topics/languages/README (see
+        _fetch_repo_extras); when not given, they are fetched here with
+        ``client``, or a client of its own. ``tags`` is the TagResolver of the
+        import run.
+        """
         Project = self.env["website.portfolio"].sudo()
-        Tag = self.env["website.portfolio.tag"].sudo()
+        tags = tags or TagResolver(self.env)
 
         owner_login = (meta.get("owner") or {}).get("login") or ""
         repo_name = meta.get("name") or ""
@@ -194,20 +179,33 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
         repo_url = meta.get("html_url") or f"https://github.com/{full_name}"
         short = meta.get("description") or ""
 
-        tag_ids = []
-        for t in self._collect_tag_names(meta, owner_login, repo_name):
-            tag = Tag.search([("name", "=", t)], limit=1) or Tag.create({"name": t})
-            tag_ids.append(tag.id)
+        existing = Project.search([("github_full_name", "=", full_name)], limit=1)
+        if existing and skip_existing:
+            return False, existing
+        if existing and not self.force_update and self._is_unchanged(meta, {
+                full_name: (existing.github_pushed_at, existing.github_updated_at)}):
+            return False, existing
+
+        if extras is None:
+            options = dict(self._fetch_options(), readme=fetch_readme)
+            if client:
+                extras = self._fetch_repo_extras(client, meta, options)
+            else:
+                with self._github_client() as own_client:
+                    extras = self._fetch_repo_extras(own_client, meta, options)
+
+        tag_names = self._collect_tag_names(meta, extras)
 
         # README and quarantine logic
         quarantine = False
         extra_tag_names = []
         long_html = ""
 
+        first_paragraph = ""
         if fetch_readme and owner_login and repo_name:
             br = meta.get("default_branch") or "main"
-            long_html = self._get_readme_html(owner_login, repo_name)
-            long_html = self._rewrite_github_links(long_html, owner_login, repo_name, br)
+            long_html, first_paragraph = rewrite_readme(
+                extras.get("readme_html") or "", owner_login, repo_name, br)
 
         if not (long_html or "").strip():
             # No README -> quarantine + tag
@@ -215,12 +213,9 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
             extra_tag_names += [NO_MD_TAG, QUARANTINE_TAG]
         elif not short:
             # README exists but no short description -> derive from README
-            short = _first_paragraph_text(long_html)
+            short = first_paragraph
 
-        # ensure extra tags exist
-        for tname in extra_tag_names:
-            tag = Tag.search([("name", "=", tname)], limit=1) or Tag.create({"name": tname})
-            tag_ids.append(tag.id)
+        tag_ids = tags.ids(tag_names + extra_tag_names)
 
         # publishing state: quarantine forces unpublish
         website_published = False if quarantine else bool(publish_now)
@@ -237,12 +232,11 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
             "publish_to": pt,
             "tag_ids": [(6, 0, tag_ids)] if tag_ids else False,
             "github_full_name": full_name,
+            "github_pushed_at": _github_datetime(meta.get("pushed_at")),
+            "github_updated_at": _github_datetime(meta.get("updated_at")),
         }
 
-        existing = Project.search([("github_full_name", "=", full_name)], limit=1)
         if existing:
-            if skip_existing:
-                return False, existing
             existing.write(vals)
             return "updated", existing
         else:
@@ -257,11 +251,12 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
         if not owner or not repo:
             raise UserError(_("Please provide a valid owner and repository."))
 
-        meta = self._get_repo(owner, repo)
-        status, rec = self._upsert_from_meta(
-            meta, self.publish_now, self.publish_from, self.publish_to,
-            self.fetch_readme, self.skip_existing,
-        )
+        with self._github_client() as client:
+            meta = client.get_repo(owner, repo)
+            status, rec = self._upsert_from_meta(
+                meta, self.publish_now, self.publish_from, self.publish_to,
+                self.fetch_readme, self.skip_existing, client=client,
+            )
         return {
             "type": "ir.actions.act_window",
             "res_model": "website.portfolio",
@@ -272,64 +267,112 @@ class WebsitePortfolioGithubWizard(models.TransientModel):
         }
 
     def action_import_all(self):
+        """Queue the import of all the owner's repos as a background job."""
         self.ensure_one()
         owner, _repo = self._normalize_owner_repo(self.owner, self.repo)
         if not owner:
             raise UserError(_("Please provide Owner (username/org)."))
 
-        created = updated = skipped = 0
-        for meta in self._iter_owner_repos(owner, self.include_private):
-            result, _rec = self._upsert_from_meta(
-                meta,
-                self.publish_now, self.publish_from, self.publish_to,
-                self.fetch_readme, self.skip_existing,
-            )
-            if result == "created":
-                created += 1
-            elif result == "updated":
-                updated += 1
-            else:
-                skipped += 1
-
+        # the wizard is read-only past its creation, the job gets the normalized owner
+        job = self.env["website.portfolio.import.job"]._enqueue(self, owner)
         return {
-            "type": "ir.actions.client",
-            "tag": "display_notification",
-            "params": {
-                "title": _("GitHub Import"),
-                "message": _("Created: %s  Updated: %s  Skipped: %s") % (created, updated, skipped),
-                "sticky": False,
-            },
+            "type": "ir.actions.act_window",
+            "res_model": "website.portfolio.import.job",
+            "res_id": job.id,
+            "view_mode": "form",
+            "target": "current",
         }
 
-    def _iter_owner_repos(self, owner, include_private=False):
+    def _get_watermarks(self, full_names):
+        """Return {github_full_name: (pushed_at, updated_at)} of the imported repos."""
+        projects = self.env["website.portfolio"].sudo().search_fetch(
+            [("github_full_name", "in", list(full_names))],
+            ["github_full_name", "github_pushed_at", "github_updated_at"],
+        )
+        return {p.github_full_name: (p.github_pushed_at, p.github_updated_at) for p in projects}
+
+    @staticmethod
+    def _is_unchanged(meta, watermarks):
+        """Whether the repo was neither pushed nor modified since it was imported."""
+        marks = watermarks.get(meta.get("full_name"))
+        return bool(marks and marks[0] and marks[1]) and marks == (
+            _github_datetime(meta.get("pushed_at")),
+            _github_datetime(meta.get("updated_at")),
+        )
+
+    def _import_repos(self, metas, client, report=None):
+        """Import the given repo JSONs; return {'created', 'updated', 'skipped', 'failed', 'pending'} counts.
+
+        Existing repos (with skip_existing) and unchanged ones (unless
+        force_update) are skipped before any extra API call. A repo failing
+        to fetch or import is rolled back alone and counted as failed; one
+        whose fetch hit the rate limit is left pending, to retry later.
+        ``report``, when given, is filled with
+        ``{full_name: {'status', 'message', 'duration'}}``.
+        """
+        counts = {"created": 0, "updated": 0, "skipped": 0, "failed": 0, "pending": 0}
+        report = {} if report is None else report
+        watermarks = self._get_watermarks(m.get("full_name") for m in metas)
+        options = self._fetch_options()
+
+        def timed_fetch(meta):
+            start = time.time()
+            return self._fetch_repo_extras(client, meta, options), time.time() - start
+
+        with ThreadPoolExecutor(GITHUB_FETCH_WORKERS) as pool:
+            # HTTP fetches run in the pool, ORM writes stay on this thread
+            jobs = []
+            for meta in metas:
+                full_name = meta.get("full_name")
+                if full_name in watermarks and (
+                        self.skip_existing or (not self.force_update and self._is_unchanged(meta, watermarks))):
+                    counts["skipped"] += 1
+                    report[full_name] = {"status": "skipped", "message": "", "duration": 0.0}
+                    continue
+                jobs.append((meta, pool.submit(timed_fetch, meta)))
+
+            fetched = []
+            for meta, future in jobs:
+                try:
+                    fetched.append((meta, *future.result()))
+                except GithubRateLimited as e:
+                    counts["pending"] += 1
+                    report[meta.get("full_name")] = {"status": "pending", "message": str(e), "duration": 0.0}
+                except Exception as e:
+                    _logger.warning("website_portfolio: fetching %s failed: %s", meta.get("full_name"), e)
+                    counts["failed"] += 1
+                    report[meta.get("full_name")] = {"status": "failed", "message": str(e), "duration": 0.0}
+
+        # create the tags of the whole run at once
+        tags = TagResolver(self.env)
+        tags.ensure(sorted({name for meta, extras, _t in fetched for name in self._collect_tag_names(meta, extras)}))
+
+        for meta, extras, fetch_time in fetched:
+            start = time.time()
+            message = ""
+            try:
+                with self.env.cr.savepoint():
+                    result, _rec = self._upsert_from_meta(
+                        meta,
+                        self.publish_now, self.publish_from, self.publish_to,
+                        self.fetch_readme, self.skip_existing,
+                        extras=extras, tags=tags,
+                    )
+                result = result or "skipped"
+            except SerializationFailure:
+                # the transaction is stale: retried as a whole by the caller
+                raise
+            except Exception as e:
+                _logger.warning("website_portfolio: importing %s failed: %s", meta.get("full_name"), e)
+                result, message = "failed", str(e)
+            counts[result] += 1
+            report[meta.get("full_name")] = {
+                "status": result,
+                "message": message,
+                "duration": fetch_time + time.time() - start,
+            }
+        return counts
+
+    def _iter_owner_repos(self, owner, include_private, client):
         """Yield repo JSON for user/org with pagination."""
-        u = requests.get(f"{GITHUB_API}/users/{owner}", headers=self._headers(), timeout=20)
-        if u.status_code == 404:
-            raise UserError(_("GitHub owner not found: %s") % owner)
-        if u.status_code != 200:
-            raise UserError(_("Owner lookup failed (%s): %s") % (u.status_code, u.text))
-        is_org = (u.json().get("type") == "Organization")
-
-        base = f"{GITHUB_API}/orgs/{owner}/repos" if is_org else f"{GITHUB_API}/users/{owner}/repos"
-        params = {
-            "per_page": 100,
-            "type": "all" if include_private else "public",
-            "sort": "full_name",
-            "direction": "asc",
-        }
-        page = 1
-        while True:
-            params["page"] = page
-            r = requests.get(base, headers=self._headers(), params=params, timeout=30)
-            if r.status_code in (401, 403) and include_private:
-                raise UserError(_("Including private repositories requires a token with 'repo' scope."))
-            if r.status_code != 200:
-                raise UserError(_("Repo listing failed (%s): %s") % (r.status_code, r.text))
-            items = r.json() or []
-            if not items:
-                break
-            for meta in items:
-                yield meta
-            if len(items) < 100:
-                break
-            page += 1
+        return client.iter_owner_repos(owner, include_private)